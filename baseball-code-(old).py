@@ -1,75 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 from io import StringIO
-import time
 
 # Used copied records from https://www.fangraphs.com/roster-resource/injury-report?timeframe=all&groupby=all&status=&injury=&season=2022 for injury reports
 # Now defunct, better method for baseball records was found 
 
-class TooManyRequests(Exception):
-    """Too many requests"""
-
-def remove_suffixes(name, suffixes):
-    cleaned_name = name
-    for suffix in suffixes:
-        if cleaned_name.endswith(suffix):
-            cleaned_name = cleaned_name[:-len(suffix)].strip()
-            break
-    return cleaned_name
-
-def get_player_birthday(player_name):
-    suffixes = ['Jr.', 'Sr.', 'II', 'III', 'IV', 'V']
-    cleaned_name = remove_suffixes(player_name, suffixes)
-    names = cleaned_name.split()
-    if len(names) < 2:
-        print(f"Invalid player name format: {player_name}")
-        return None
-
-    last_name = names[-1].lower()[:5]
-    first_name = names[0].lower()
-    first_two_letters_first_name = first_name[:2]
-    first_letter_last_name = last_name[0]
-    suffix = "01"
-
-    while True:
-        player_url = f"https://www.baseball-reference.com/players/{first_letter_last_name}/{last_name}{first_two_letters_first_name}{suffix}.shtml"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
-        try:
-            response = requests.get(player_url, headers=headers)
-            if response.status_code == 429:
-                raise TooManyRequests
-
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            birth_span = soup.find('span', {'id': 'necro-birth'})
-            if birth_span:
-                birthday = birth_span['data-birth']
-                if int(birthday[:4]) >= 1980:
-                    return birthday
-                else:
-                    print(f"Found birthday before 1980 for {player_name}. Trying next suffix.")
-                    suffix = f"{int(suffix) + 1:02}"
-            else:
-                print(f"No birthday found for {player_name}. Trying next suffix.")
-                suffix = f"{int(suffix) + 1:02}"
-
-        except TooManyRequests:
-            print(f"Rate limit hit for {player_name}, retrying after delay...")
-            time.sleep(30)  # Longer delay for rate limit
-            continue
-        except requests.exceptions.RequestException as e:
-            print(f"Error retrieving data for {player_name}: {e}")
-            return None
-        except (AttributeError, TypeError) as e:
-            print(f"Error parsing data for {player_name}: {e}")
-            return None
-        time.sleep(10)  # General delay between requests
-
-    return None
+# Birthday lookups go through injury_pipeline.profiles: one adaptive rate limiter for the site,
+# a few players at a time, and a cache in profile_cache/ so reruns only look up new players
+from injury_pipeline.profiles import BirthdayLookup
 
 def extract_player_names(data):
     df = pd.read_csv(StringIO(data), delimiter='\t')
@@ -179,10 +116,7 @@ Ryan Sherriff	PHI	RP	03/28/22	Biceps tendinitis	Activated	04/04/22	06/03/22	08/0
 LaMonte Wade Jr.	SFG	OF	03/28/22	Knee inflammation	Activated	04/04/22	04/14/22	05/06/22	Activated"""
 
 player_names = extract_player_names(data)
-birthdays = {}
-for player_name in player_names:
-    birthday = get_player_birthday(player_name)
-    birthdays[player_name] = birthday
+birthdays = BirthdayLookup().birthdays(player_names)
 
 df = pd.DataFrame(list(birthdays.items()), columns=['Name', 'Birthday'])
 print(df)
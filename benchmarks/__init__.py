@@ -0,0 +1,4 @@
+# Offline benchmarks for the injury pipeline
+# server: local stand-in for the prosportstransactions search pages (latency and 429 injection)
+# synthetic: rosters and injury histories at any multiple of the real volume
+# Run with: python -m benchmarks --scale 1 10 --out benchmark.json
@@ -0,0 +1,182 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from injury_pipeline.days_out import calculate_days_out
+from injury_pipeline.fetch import PageFetcher
+from injury_pipeline.injuries import classify_injuries
+from injury_pipeline.matching import ExactThenFuzzy, SubstringThenFuzzy
+from injury_pipeline.parse import BACKENDS, parse_rows
+from injury_pipeline.pipeline import process_injuries
+from injury_pipeline.schema import ROSTER_SCHEMA, apply_schema
+from injury_pipeline.sports import get_sport
+from injury_pipeline.stream import clean_rows, write_incrementally
+
+from .server import StandInServer
+from .synthetic import generate, write_sources
+
+STAGES = ['fetch', 'parse', 'names', 'days_out', 'filter', 'output', 'pipeline']
+
+# Best wall time of `repeat` calls to fn(), with fn's last return value
+def _best_of(fn, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def _record(results, scale, stage, seconds, rows, **extra):
+    entry = {'scale': scale, 'stage': stage, 'seconds': round(seconds, 6), 'rows': rows,
+             'rows_per_second': round(rows / seconds, 1) if seconds else None, **extra}
+    results.append(entry)
+    print(f"  {stage:<26} {seconds:9.3f}s  {rows:>9} rows", file=sys.stderr)
+
+# Every stage at one scale; stages after fetch work on what the stand-in server served
+def run_scale(scale, stages, repeat, latency, throttle_every, concurrency, workdir):
+    results = []
+    roster, transactions = generate(scale)
+    roster = apply_schema(roster, ROSTER_SCHEMA)
+    sport = get_sport('baseball')
+    base_url = sport.search_url('2005-01-01', '2024-12-31', '')
+
+    with StandInServer(transactions, latency=latency, throttle_every=throttle_every) as server:
+        pages = []
+
+        def keep_page(html):
+            pages.append(html)
+            return parse_rows(html)
+
+        fetcher = PageFetcher(concurrency=concurrency)
+        started = time.perf_counter()
+        rows = fetcher.fetch_all(server.url + base_url, parse=keep_page)
+        if 'fetch' in stages:
+            _record(results, scale, 'fetch', time.perf_counter() - started, len(rows), pages=len(pages),
+                    requests=server.requests, throttled=server.throttled)
+
+        if 'parse' in stages:
+            for backend, parse in BACKENDS.items():
+                seconds, parsed = _best_of(lambda: [row for page in pages for row in parse(page)], repeat)
+                _record(results, scale, f"parse[{backend}]", seconds, len(parsed), pages=len(pages))
+
+        injuries = clean_rows(rows)
+        names = list(injuries['Player'].unique())
+        if 'names' in stages:
+            for matcher in (SubstringThenFuzzy, ExactThenFuzzy):
+                seconds, (positions, _) = _best_of(lambda: matcher(roster['Player']).match(names), repeat)
+                _record(results, scale, f"names[{matcher.__name__}]", seconds, len(names),
+                        matched=sum(position is not None for position in positions))
+
+        # Injuries with the roster joined on the exact name, as process_injuries sees them
+        merged = pd.merge(injuries, roster.astype({'Player': 'category'}), on='Player', how='inner').sort_values(['Player', 'Date'])
+        if 'days_out' in stages:
+            seconds, paired = _best_of(lambda: calculate_days_out(merged), repeat)
+            _record(results, scale, 'days_out', seconds, len(merged), paired=len(paired))
+
+        if 'filter' in stages:
+            notes = calculate_days_out(merged)['Notes']
+            seconds, labels = _best_of(lambda: classify_injuries(notes), repeat)
+            _record(results, scale, 'filter', seconds, len(notes), kept=int(labels['Include'].sum()))
+
+        processed = process_injuries(injuries, roster, ExactThenFuzzy(roster['Player']), [])
+        if 'output' in stages:
+            csv_path = os.path.join(workdir, 'output.csv')
+            seconds, written = _best_of(lambda: write_incrementally([processed], lambda chunk: chunk, csv_path), repeat)
+            _record(results, scale, 'output[csv]', seconds, written)
+            try:
+                from injury_pipeline.store import DatasetWriter
+
+                def write_store():
+                    writer = DatasetWriter(os.path.join(workdir, 'store'), 'MLB')
+                    writer.write(processed)
+                    return len(writer.commit())
+                seconds, seasons = _best_of(write_store, repeat)
+                _record(results, scale, 'output[parquet]', seconds, len(processed), seasons=seasons)
+            except ImportError:
+                pass
+
+        if 'pipeline' in stages:
+            from injury_pipeline.pipeline import run_sport
+            write_sources(roster, workdir)
+            cwd = os.getcwd()
+            os.chdir(workdir)
+            try:
+                started = time.perf_counter()
+                run_sport('basketball', source=server.url, store_dir=None, features_dir=None, output_dir=workdir)
+                seconds = time.perf_counter() - started
+            finally:
+                os.chdir(cwd)
+            output = pd.read_csv(os.path.join(workdir, 'Merged_NBA_Player_Injuries_with_details.csv'))
+            _record(results, scale, 'pipeline', seconds, len(output))
+    return results
+
+# Stages that got slower than the baseline by more than `tolerance` (a ratio); both are result lists
+def regressions(results, baseline, tolerance):
+    previous = {(entry['scale'], entry['stage']): entry['seconds'] for entry in baseline}
+    slower = []
+    for entry in results:
+        before = previous.get((entry['scale'], entry['stage']))
+        if before and entry['seconds'] > before * tolerance:
+            slower.append({'scale': entry['scale'], 'stage': entry['stage'], 'before': before, 'after': entry['seconds']})
+    return slower
+
+# python -m benchmarks --scale 1 10 100 --out benchmark.json --compare previous.json
+def main():
+    parser = argparse.ArgumentParser(prog='benchmarks', description='Benchmark each pipeline stage offline.')
+    parser.add_argument('--scale', type=float, nargs='+', default=[1, 10], help='multiples of one sport\'s real volume')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES)
+    parser.add_argument('--repeat', type=int, default=3, help='runs per CPU-bound stage; the best time is kept')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to each stand-in response')
+    parser.add_argument('--throttle-every', type=int, default=None, help='answer every n-th request with a 429')
+    parser.add_argument('--concurrency', type=int, default=8, help='pages the fetcher keeps in flight')
+    parser.add_argument('--out', help='JSON results file (default: stdout)')
+    parser.add_argument('--compare', help='earlier results file; exit 1 when a stage got slower than --tolerance allows')
+    parser.add_argument('--tolerance', type=float, default=1.25)
+    args = parser.parse_args()
+
+    results = []
+    for scale in args.scale:
+        print(f"scale {scale:g}x", file=sys.stderr)
+        workdir = tempfile.mkdtemp(prefix='injury-bench-')
+        try:
+            # The pipeline's progress messages go to stderr so stdout stays valid JSON
+            with contextlib.redirect_stdout(sys.stderr):
+                results.extend(run_scale(scale, args.stages, args.repeat, args.latency, args.throttle_every,
+                                         args.concurrency, workdir))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            slower = regressions(results, json.load(f)['results'], args.tolerance)
+        for entry in slower:
+            print(f"slower: {entry['stage']} at {entry['scale']:g}x, {entry['before']:.3f}s -> {entry['after']:.3f}s", file=sys.stderr)
+        if slower:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+import html
+import threading
+from bisect import bisect_left, bisect_right
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from injury_pipeline.fetch import PAGE_SIZE
+
+HEADER_ROW = ('<tr align="center" bgcolor="#CCCCCC"><td><b>Date</b></td><td><b>Team</b></td>'
+              '<td><b>Acquired</b></td><td><b>Relinquished</b></td><td><b>Notes</b></td></tr>')
+
+def _name_cell(name):
+    return f"<td> &bull; {html.escape(name)}</td>" if name else "<td> </td>"
+
+# One results page in the site's markup: a "datatable" table, a header row, then one row per transaction
+def render_page(rows):
+    if not rows:
+        return "<html><body><p>No results found.</p></body></html>"
+    body = ''.join(
+        f'<tr align="left" bgcolor="#FFFFFF"><td> {day}</td><td> {html.escape(team)}</td>'
+        f'{_name_cell(acquired)}{_name_cell(relinquished)}<td> {html.escape(notes)}</td></tr>\n'
+        for day, team, acquired, relinquished, notes in rows
+    )
+    return ('<html><body><table class="datatable center" cellpadding="2" cellspacing="0" border="1">'
+            f'{HEADER_ROW}\n{body}</table></body></html>')
+
+# Local stand-in for the SearchResults.php pages of every sport
+# transactions: (Date, Team, Acquired, Relinquished, Notes) tuples sorted by date; BeginDate/EndDate/start
+# select the page the same way the site does
+# latency: seconds added to every response; throttle_every: every n-th request gets a 429 with Retry-After
+class StandInServer:
+    def __init__(self, transactions, latency=0.0, throttle_every=None, retry_after=1, host='127.0.0.1', port=0):
+        self.transactions = transactions
+        self.dates = [row[0] for row in transactions]
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.requests = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def page(self, begin, end, start):
+        low = bisect_left(self.dates, begin)
+        high = bisect_right(self.dates, end)
+        first = low + start
+        return self.transactions[first:min(first + PAGE_SIZE, high)] if first < high else []
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                    throttle = server.throttle_every and server.requests % server.throttle_every == 0
+                    if throttle:
+                        server.throttled += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                if throttle:
+                    self.send_response(429)
+                    self.send_header('Retry-After', str(server.retry_after))
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                query = parse_qs(urlsplit(self.path).query)
+                rows = server.page(query.get('BeginDate', [''])[0], query.get('EndDate', ['9999'])[0],
+                                   int(query.get('start', ['0'])[0] or 0))
+                body = render_page(rows).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
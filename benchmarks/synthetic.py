@@ -0,0 +1,92 @@
+import os
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# Volume of one sport at scale 1: roster rows and injuries (~2-3,000 injuries per sport)
+BASE_PLAYERS = 5000
+BASE_INJURIES = 3000
+
+FIRST_NAMES = ['Aaron', 'Brandon', 'Carlos', 'Derek', 'Elijah', 'Felix', 'Gavin', 'Hector', 'Isaac', 'Jorge',
+               'Kevin', 'Lucas', 'Marcus', 'Nolan', 'Omar', 'Pedro', 'Quinn', 'Rafael', 'Trevor', 'Victor']
+SYLLABLES = ['Bar', 'Cor', 'Dal', 'Fen', 'Gor', 'Har', 'Kel', 'Lom', 'Mar', 'Nev',
+             'Par', 'Ros', 'San', 'Tor', 'Val', 'Wes', 'Yor', 'Zan', 'Bel', 'Dun']
+POSITIONS = ['P', 'C', '1B', '2B', '3B', 'SS', 'LF', 'CF', 'RF', 'DH']
+TEAMS = ['Yankees', 'Red Sox', 'Dodgers', 'Giants', 'Cubs', 'Mets', 'Braves', 'Astros']
+INJURY_NOTES = [
+    'placed on 15-day IL with strained left hamstring', 'placed on 10-day IL with sprained right ankle',
+    'placed on 60-day IL recovering from Tommy John surgery (elbow)', 'placed on IL with torn ACL in left knee',
+    'placed on 15-day IL with lower back tightness', 'placed on IL with right shoulder inflammation',
+    'placed on 10-day IL with strained oblique', 'placed on IL with fractured right wrist',
+    'placed on 7-day IL with concussion', 'placed on 10-day IL with plantar fasciitis (foot)',
+    'placed on IL with flu-like symptoms', 'placed on 10-day IL (undisclosed)',
+    # No body part named, so the output row carries a null Body part
+    'placed on 15-day IL',
+]
+RETURN_NOTE = 'returned to lineup'
+
+# Synthetic rosters and injury transactions, scale times the volume of one real sport
+# roster: Player, DOB, Height (inches), Weight, Position, one row per player
+# transactions: (Date, Team, Acquired, Relinquished, Notes) sorted by date, as the search pages list them;
+# injuries name the player under Relinquished, returns under Acquired, and about 5% of the
+# injury-list spellings differ from the roster (a Jr. suffix or a dropped last letter) to exercise fuzzy matching
+def generate(scale=1, seed=0, begin='2005-01-01', end='2024-12-31'):
+    rng = np.random.default_rng(seed)
+    players = int(BASE_PLAYERS * scale)
+    injuries = int(BASE_INJURIES * scale)
+
+    i = np.arange(players)
+    first = np.array(FIRST_NAMES)[i % len(FIRST_NAMES)]
+    k = i // len(FIRST_NAMES)
+    syllables = np.array(SYLLABLES)
+    last = (pd.Series(syllables[k % 20]) + pd.Series(np.char.lower(syllables[(k // 20) % 20]))
+            + pd.Series(np.char.lower(syllables[(k // 400) % 20])) + np.where(k >= 8000, (k // 8000).astype(str), ''))
+    names = pd.Series(first) + ' ' + last
+    roster = pd.DataFrame({
+        'Player': names,
+        'DOB': pd.Timestamp('1965-01-01') + pd.to_timedelta(rng.integers(0, 37 * 365, players), unit='D'),
+        'Height': rng.normal(74, 2.5, players).round().astype(int),
+        'Weight': rng.normal(205, 20, players).round().astype(int),
+        'Position': rng.choice(POSITIONS, players),
+    })
+
+    # Injury-prone players come up again and again: squaring a uniform draw puts most injuries on a minority
+    injured = rng.permutation(players)[(players * rng.random(injuries) ** 2).astype(int)]
+    span = (date.fromisoformat(end) - date.fromisoformat(begin)).days
+    injury_dates = pd.Timestamp(begin) + pd.to_timedelta(rng.integers(0, span, injuries), unit='D')
+    days_out = np.clip(rng.lognormal(3.0, 0.9, injuries).round().astype(int), 1, 364)
+    return_dates = injury_dates + pd.to_timedelta(days_out, unit='D')
+
+    listed = names.to_numpy()[injured].astype(object)
+    variants = rng.random(injuries) < 0.05
+    listed[variants] = [name + ' Jr.' if n % 2 else name[:-1] for n, name in zip(range(variants.sum()), listed[variants])]
+    teams = rng.choice(TEAMS, injuries)
+
+    placed = pd.DataFrame({'Date': injury_dates, 'Team': teams, 'Acquired': '', 'Relinquished': listed,
+                           'Notes': rng.choice(INJURY_NOTES, injuries)})
+    returned = pd.DataFrame({'Date': return_dates, 'Team': teams, 'Acquired': listed, 'Relinquished': '',
+                             'Notes': RETURN_NOTE})
+    transactions = pd.concat([placed, returned], ignore_index=True)
+    transactions = transactions[transactions['Date'] <= pd.Timestamp(end)].sort_values('Date', kind='stable')
+    transactions['Date'] = transactions['Date'].dt.strftime('%Y-%m-%d')
+    return roster, list(transactions.itertuples(index=False, name=None))
+
+# Write the roster in the layouts of the real source files:
+# master.csv + biofile.csv (baseball), common_player_info.csv (basketball), nfl_players.csv / nhl_players.csv
+def write_sources(roster, directory):
+    os.makedirs(directory, exist_ok=True)
+    first = roster['Player'].str.split(' ', n=1).str[0]
+    last = roster['Player'].str.split(' ', n=1).str[1]
+    feet_inches = (roster['Height'] // 12).astype(str) + '-' + (roster['Height'] % 12).astype(str)
+
+    pd.DataFrame({'mlb_name': roster['Player'], 'mlb_pos': roster['Position'],
+                  'birth_date': roster['DOB'].dt.strftime('%Y-%m-%d')}).to_csv(os.path.join(directory, 'master.csv'), index=False)
+    pd.DataFrame({'NICKNAME': first, 'FIRST': first, 'LAST': last, 'BIRTHDATE': roster['DOB'].dt.strftime('%m/%d/%Y'),
+                  'HEIGHT': feet_inches, 'WEIGHT': roster['Weight']}).to_csv(os.path.join(directory, 'biofile.csv'), index=False)
+    pd.DataFrame({'display_first_last': roster['Player'], 'birthdate': roster['DOB'].dt.strftime('%Y-%m-%d 00:00:00'),
+                  'position': roster['Position'], 'height': feet_inches,
+                  'weight': roster['Weight']}).to_csv(os.path.join(directory, 'common_player_info.csv'), index=False)
+    players = roster.assign(DOB=roster['DOB'].dt.strftime('%Y-%m-%d'))
+    players.to_csv(os.path.join(directory, 'nfl_players.csv'), index=False)
+    players.to_csv(os.path.join(directory, 'nhl_players.csv'), index=False)
@@ -0,0 +1,3 @@
+# Injury data pipeline for the sports covered by prosportstransactions.com
+# Each sport is a plugin in injury_pipeline.sports; run_sport runs one, run_sports several in parallel processes
+# Command line: python -m injury_pipeline baseball basketball
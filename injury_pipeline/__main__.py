@@ -0,0 +1,46 @@
+import argparse
+
+from .runner import run_sports
+from .sports import SOURCE, SPORT_MODULES
+from .changes import CHANGES_DIR
+from .cube import CUBE_DIR
+from .features import FEATURES_DIR
+from .store import STORE_DIR
+
+# python -m injury_pipeline baseball basketball --begin 2005-01-01 --end 2024-12-31
+def main():
+    parser = argparse.ArgumentParser(prog='injury_pipeline', description='Scrape and merge injury data for one or more sports.')
+    parser.add_argument('sports', nargs='+', choices=SPORT_MODULES)
+    parser.add_argument('--begin', default='2005-01-01')
+    parser.add_argument('--end', default='2024-12-31')
+    parser.add_argument('--processes', type=int, default=None, help='sports run at once (default: all)')
+    parser.add_argument('--fetch-budget', type=int, default=4, help='simultaneous requests to the source site, shared by all sports')
+    parser.add_argument('--workers', type=int, default=4, help='date shards scraped at once per sport')
+    parser.add_argument('--full', action='store_true', help='re-fetch every page instead of only pages after the newest cached date')
+    parser.add_argument('--offline', action='store_true', help='run from the page cache alone')
+    parser.add_argument('--in-memory', action='store_true', help='process all injuries in one frame after the crawl instead of a year at a time while it runs')
+    parser.add_argument('--output-dir', default='.')
+    parser.add_argument('--source', default=SOURCE, help='site serving the search pages')
+    parser.add_argument('--store-dir', default=STORE_DIR, help='Parquet dataset partitioned by sport and season')
+    parser.add_argument('--no-store', action='store_true', help='skip the Parquet dataset')
+    parser.add_argument('--no-csv', action='store_true', help='skip the Merged_*.csv export')
+    parser.add_argument('--features-dir', default=FEATURES_DIR, help='rolling per-player injury features')
+    parser.add_argument('--no-features', action='store_true', help='skip the feature store update')
+    parser.add_argument('--changes-dir', default=CHANGES_DIR, help='deltas of inserted/updated/deleted records between runs')
+    parser.add_argument('--no-changes', action='store_true', help='skip the change-data-capture delta')
+    parser.add_argument('--cube-dir', default=CUBE_DIR, help='aggregate cube by sport, season, position, injury and age band')
+    parser.add_argument('--no-cube', action='store_true', help='skip the aggregate cube update')
+    parser.add_argument('--no-summary', action='store_true', help='skip the <label>_run_summary.json timings')
+    parser.add_argument('--profile-stage', choices=['fetch', 'parse', 'roster', 'match', 'days_out', 'filter', 'write', 'cube'],
+                        help='run one stage under cProfile and save <label>_<stage>.prof')
+    args = parser.parse_args()
+
+    run_sports(args.sports, processes=args.processes, fetch_budget=args.fetch_budget, begin=args.begin, end=args.end,
+               workers=args.workers, incremental=not args.full, offline=args.offline, streaming=not args.in_memory,
+               output_dir=args.output_dir, source=args.source, store_dir=None if args.no_store else args.store_dir,
+               csv=not args.no_csv, features_dir=None if args.no_features else args.features_dir,
+               changes_dir=None if args.no_changes else args.changes_dir, cube_dir=None if args.no_cube else args.cube_dir,
+               summary=not args.no_summary, profile_stage=args.profile_stage)
+
+if __name__ == '__main__':
+    main()
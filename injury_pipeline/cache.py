@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+# Default limits: a day for pages that may still change, 500 MB on disk
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+# Cache key for a results page: (host, sport, BeginDate, EndDate, start offset) taken from its URL
+def page_key(url):
+    parts = urlsplit(url)
+    query = parse_qs(parts.query, keep_blank_values=True)
+    sport = parts.path.strip('/').split('/')[0]
+
+    def value(name):
+        return query.get(name, [''])[0]
+
+    return f"{parts.netloc}|{sport}|{value('BeginDate')}|{value('EndDate')}|{value('start') or '0'}"
+
+def _range_of(key):
+    return key.rsplit('|', 1)[0]
+
+# On-disk cache of results pages
+# Page bodies are stored once under the SHA-256 of their content (objects/), and index.json maps
+# each page key to its content hash, fetch time and the newest Date on the page
+class PageCache:
+    def __init__(self, directory, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(directory, 'objects')
+        self.index_path = os.path.join(directory, 'index.json')
+        self._lock = threading.Lock()
+        self._dirty = False
+        os.makedirs(self.objects_dir, exist_ok=True)
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                self.index = json.load(f)
+        else:
+            self.index = {}
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest + '.html')
+
+    # Newest Date seen on any cached page of the same sport and date range
+    def newest_date(self, url):
+        search = _range_of(page_key(url))
+        with self._lock:
+            dates = [entry['last_date'] for key, entry in self.index.items() if _range_of(key) == search and entry['last_date']]
+        return max(dates) if dates else None
+
+    # Cached page body, or None on a miss
+    # With incremental=True, pages are reused only when every row on them is older than `frontier`
+    # (results are listed oldest first, so those pages can no longer change); otherwise the TTL applies
+    # With stale_ok=True any cached copy is returned (offline runs)
+    def get(self, url, incremental=False, frontier=None, stale_ok=False):
+        key = page_key(url)
+        with self._lock:
+            entry = self.index.get(key)
+            if entry is None:
+                return None
+            if stale_ok:
+                pass
+            elif incremental:
+                if frontier is None or not entry['last_date'] or entry['last_date'] >= frontier:
+                    return None
+            elif self.ttl is not None and time.time() - entry['fetched_at'] > self.ttl:
+                return None
+            path = self._object_path(entry['hash'])
+            if not os.path.exists(path):
+                del self.index[key]
+                self._dirty = True
+                return None
+            entry['accessed_at'] = time.time()
+            self._dirty = True
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    # Store a page body along with the rows parsed from it
+    def put(self, url, html, rows):
+        body = html.encode('utf-8')
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock:
+            self.index[page_key(url)] = {
+                'hash': digest,
+                'size': len(body),
+                'fetched_at': now,
+                'accessed_at': now,
+                'last_date': max(row[0] for row in rows) if rows else None,
+            }
+            self._dirty = True
+
+    # Drop the least recently used pages until the cache fits in max_bytes
+    def evict(self):
+        with self._lock:
+            sizes = {}
+            for entry in self.index.values():
+                sizes[entry['hash']] = entry['size']
+            total = sum(sizes.values())
+            if self.max_bytes is None or total <= self.max_bytes:
+                return
+            for key in sorted(self.index, key=lambda k: self.index[k]['accessed_at']):
+                if total <= self.max_bytes:
+                    break
+                digest = self.index.pop(key)['hash']
+                if not any(entry['hash'] == digest for entry in self.index.values()):
+                    total -= sizes[digest]
+                    if os.path.exists(self._object_path(digest)):
+                        os.remove(self._object_path(digest))
+            self._dirty = True
+
+    # Write the index back to disk (after evicting down to the size limit)
+    def save(self):
+        self.evict()
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
+            self._dirty = False
@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from .frames import concat_frames, load_frame, write_frame
+
+CHANGES_DIR = 'changes'
+KEY_COLUMNS = ['Player', 'Injury date', 'Injury']
+CHANGE_INSERT, CHANGE_UPDATE, CHANGE_DELETE = 'insert', 'update', 'delete'
+
+# Stable hex digest per row of the given columns (same values -> same hash on every run and machine)
+# Missing values hash as '\x00', which no real value spells, so a null never collides with 'nan' or ''
+def _hash_text(values):
+    return values.astype(str).where(values.notna(), '\x00')
+
+def _row_hashes(df, columns):
+    text = _hash_text(df[columns[0]]).str.cat([_hash_text(df[column]) for column in columns[1:]], sep='\x1f')
+    return text.map(lambda value: hashlib.blake2b(value.encode(), digest_size=8).hexdigest())
+
+# Change-data capture for one sport's output, kept in <root>/<label>/:
+#   snapshot: every record of the last run with its Key (hash of Player, Injury date, Injury) and Hash (all columns)
+#   delta-<seq>.csv: Change (insert/update/delete), Key and the record (the old values for deletes)
+#   manifest.json: one entry per delta, in the order consumers should apply them
+# A run only vouches for injuries dated inside its window, so snapshot records outside it are never deleted
+# After commit(), `added` and `removed` hold the records that entered and left the output (an update is
+# its old version removed and its new one added), for stages that maintain aggregates (see cube.py)
+class ChangeTracker:
+    def __init__(self, root, sport_label):
+        self.directory = os.path.join(root, sport_label)
+        self.manifest_path = os.path.join(self.directory, 'manifest.json')
+        self.chunks = []
+        self.added = None
+        self.removed = None
+
+    def update(self, df):
+        if not df.empty:
+            self.chunks.append(df)
+
+    def _snapshot(self):
+        return load_frame(os.path.join(self.directory, 'snapshot'))
+
+    def _manifest(self):
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        return []
+
+    # Sequence of the last delta in the manifest (0 before the first one)
+    def sequence(self):
+        manifest = self._manifest()
+        return manifest[-1]['sequence'] if manifest else 0
+
+    # Every record of the last committed run, without Key and Hash (None before the first commit)
+    def records(self):
+        snapshot = self._snapshot()
+        return None if snapshot is None else snapshot.drop(columns=['Key', 'Hash'])
+
+    # Diff this run's records against the snapshot over [begin, end], write the delta and the new snapshot
+    # Returns the manifest entry, or None when nothing changed
+    def commit(self, begin=None, end=None):
+        current = pd.concat(self.chunks, ignore_index=True) if self.chunks else None
+        self.chunks = []
+        previous = self._snapshot()
+        if current is None and previous is None:
+            return None
+        columns = list((current if current is not None else previous).columns.drop(['Key', 'Hash'], errors='ignore'))
+        if current is None:
+            current = previous.iloc[:0][columns]
+        current = current.assign(Key=_row_hashes(current, KEY_COLUMNS), Hash=_row_hashes(current, columns))
+        current = current.drop_duplicates(subset='Key', keep='first')
+        if previous is None:
+            previous = current.iloc[:0]
+
+        in_window = pd.Series(True, index=previous.index)
+        if begin is not None:
+            in_window &= previous['Injury date'] >= pd.Timestamp(begin)
+        if end is not None:
+            in_window &= previous['Injury date'] <= pd.Timestamp(end)
+        outside = previous[~in_window]
+        previous = previous[in_window]
+
+        previous_hash = previous.set_index('Key')['Hash']
+        known = current['Key'].isin(previous_hash.index)
+        changed = known & (current['Hash'] != current['Key'].map(previous_hash))
+        deleted = previous[~previous['Key'].isin(current['Key'])]
+
+        delta = pd.concat([
+            current[~known].assign(Change=CHANGE_INSERT),
+            current[changed].assign(Change=CHANGE_UPDATE),
+            deleted.assign(Change=CHANGE_DELETE),
+        ], ignore_index=True)
+        self.added = pd.concat([current[~known], current[changed]], ignore_index=True)[columns]
+        # reindex: a snapshot from an older output layout may lack some of today's columns
+        self.removed = pd.concat([previous[previous['Key'].isin(current.loc[changed, 'Key'])], deleted], ignore_index=True).reindex(columns=columns)
+        snapshot = concat_frames([outside, current])
+
+        os.makedirs(self.directory, exist_ok=True)
+        write_frame(snapshot, os.path.join(self.directory, 'snapshot'))
+        if delta.empty:
+            return None
+
+        manifest = self._manifest()
+        sequence = manifest[-1]['sequence'] + 1 if manifest else 1
+        delta_file = f"delta-{sequence:06d}.csv"
+        delta[['Change', 'Key'] + columns].to_csv(os.path.join(self.directory, delta_file), index=False)
+        entry = {
+            'sequence': sequence,
+            'file': delta_file,
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'window': [begin, end],
+            'inserted': int((~known).sum()),
+            'updated': int(changed.sum()),
+            'deleted': len(deleted),
+            'records': len(snapshot),
+        }
+        manifest.append(entry)
+        tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+        return entry
@@ -0,0 +1,173 @@
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .frames import load_frame, remove_frame, write_frame
+from .store import season_of
+
+CUBE_DIR = 'injury_cube'
+DIMENSIONS = ['sport', 'season', 'Position', 'Injury type', 'Age band']
+AGE_BANDS = [0, 25, 30, 35, np.inf]
+AGE_BAND_LABELS = ['<25', '25-29', '30-34', '35+']
+MEASURES = ['Age', 'Height', 'Weight']
+
+def age_bands(ages):
+    return pd.cut(ages.astype('float64'), AGE_BANDS, right=False, labels=AGE_BAND_LABELS).astype(str).replace('nan', 'unknown')
+
+def _dimensions(df, sport_label, season_start_month):
+    return pd.DataFrame({
+        'sport': sport_label,
+        'season': season_of(df['Injury date'], season_start_month).astype('float64').fillna(-1).astype(int).to_numpy(),
+        'Position': df['Position'].astype('string').fillna('').to_numpy(dtype=object),
+        'Injury type': df['Injury type'].astype('string').fillna('').to_numpy(dtype=object),
+        'Age band': age_bands(df['Age']).to_numpy(),
+    })
+
+# Cell totals for a batch of output rows; sign=-1 gives the totals to subtract for rows that left the output
+# Every measure is kept as count/sum/sum of squares so cells can be added, subtracted and rolled up exactly
+def _cells(df, sport_label, season_start_month, sign=1):
+    dims = _dimensions(df, sport_label, season_start_month)
+    values = {'Injuries': np.ones(len(df), dtype='int64'), 'Days out total': df['Days out'].astype('float64').fillna(0).to_numpy()}
+    for measure in MEASURES:
+        column = df[measure].astype('float64').to_numpy()
+        known = ~np.isnan(column)
+        values[f"{measure} n"] = known.astype('int64')
+        values[f"{measure} sum"] = np.where(known, column, 0.0)
+        values[f"{measure} sumsq"] = np.where(known, column ** 2, 0.0)
+    cells = pd.concat([dims, pd.DataFrame(values)], axis=1).groupby(DIMENSIONS, as_index=False).sum()
+    days = dims.assign(**{'Days out': df['Days out'].astype('float64').fillna(-1).astype(int).to_numpy(), 'n': 1})
+    days = days.groupby(DIMENSIONS + ['Days out'], as_index=False)['n'].sum()
+    numeric = [column for column in cells.columns if column not in DIMENSIONS]
+    cells[numeric] = cells[numeric] * sign
+    days['n'] *= sign
+    return cells, days
+
+def _merge(current, change, keys):
+    if current is None or current.empty:
+        merged = change
+    else:
+        merged = pd.concat([current, change], ignore_index=True).groupby(keys, as_index=False).sum()
+    count = 'n' if 'n' in merged.columns else 'Injuries'
+    return merged[merged[count] > 0].reset_index(drop=True)
+
+# Aggregate cube of the pipeline output for one sport, kept in <root>/<label>/:
+#   cells: per (sport, season, Position, Injury type, Age band) injury count, total Days out and
+#          count/sum/sum of squares of Age, Height and Weight
+#   days:  per cell, a histogram of Days out, so medians stay exact after incremental updates and rollups
+# apply() adds the rows that entered the output and subtracts those that left it (ChangeTracker.added/removed)
+# cube.json records the sequence of the last change delta folded in (None for a missing cube), so a cube
+# that missed a delta or was never built can be rebuilt from the tracker's records instead of drifting
+class InjuryCube:
+    def __init__(self, root, sport_label, season_start_month=1):
+        self.directory = os.path.join(root, sport_label)
+        self.meta_path = os.path.join(self.directory, 'cube.json')
+        self.sport_label = sport_label
+        self.season_start_month = season_start_month
+        self.cells = self._load('cells')
+        self.days = self._load('days')
+        self.sequence = None
+        if self.cells is not None and os.path.exists(self.meta_path):
+            with open(self.meta_path) as f:
+                self.sequence = json.load(f)['sequence']
+
+    def _load(self, name):
+        return load_frame(os.path.join(self.directory, name))
+
+    def apply(self, added=None, removed=None):
+        for rows, sign in ((added, 1), (removed, -1)):
+            if rows is None or rows.empty:
+                continue
+            cells, days = _cells(rows, self.sport_label, self.season_start_month, sign)
+            self.cells = _merge(self.cells, cells, DIMENSIONS)
+            self.days = _merge(self.days, days, DIMENSIONS + ['Days out'])
+
+    # Start over from every record of the output (ChangeTracker.records())
+    def rebuild(self, records=None):
+        self.cells = None
+        self.days = None
+        self.apply(records)
+
+    # cube.json is written last, so a save cut short leaves a sequence that no longer matches and forces a rebuild
+    def save(self, sequence=None):
+        os.makedirs(self.directory, exist_ok=True)
+        for name, frame in (('cells', self.cells), ('days', self.days)):
+            if frame is not None:
+                write_frame(frame, os.path.join(self.directory, name))
+            else:
+                remove_frame(os.path.join(self.directory, name))
+        self.sequence = sequence
+        with open(self.meta_path, 'w') as f:
+            json.dump({'sequence': sequence}, f)
+
+def _select(df, filters):
+    for column, wanted in filters.items():
+        if wanted is not None:
+            wanted = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            df = df[df[column].isin(list(wanted))]
+    return df
+
+# Middle Days out per group of `keys` from summed histograms (mean of the two middle values for even counts)
+def _medians(days, keys):
+    days = days.groupby(keys + ['Days out'], as_index=False)['n'].sum().sort_values(keys + ['Days out'], kind='stable')
+    cumulative = days.groupby(keys)['n'].cumsum()
+    total = days.groupby(keys)['n'].transform('sum')
+    first = cumulative - days['n']
+    middles = [days.loc[(first < rank) & (rank <= cumulative), keys + ['Days out']] for rank in ((total + 1) // 2, total // 2 + 1)]
+    medians = middles[0].merge(middles[1], on=keys, suffixes=('', ' upper'))
+    medians['Days out median'] = (medians['Days out'] + medians['Days out upper']) / 2
+    return medians[keys + ['Days out median']]
+
+# Roll the cube up to the `by` dimensions (any of DIMENSIONS; none for a grand total) after filtering on
+# sport, season, position, injury (Injury type) and age_band (each a value or a list of values)
+def query_cube(by=None, sport=None, season=None, position=None, injury=None, age_band=None, root=CUBE_DIR):
+    by = list(by or [])
+    labels = sport if isinstance(sport, (list, tuple, set)) else ([sport] if sport else sorted(os.listdir(root)))
+    cubes = [InjuryCube(root, label) for label in labels if os.path.isdir(os.path.join(root, label))]
+    cubes = [cube for cube in cubes if cube.cells is not None]
+    if not cubes:
+        return pd.DataFrame(columns=by + ['Injuries'])
+    filters = {'sport': sport, 'season': season, 'Position': position, 'Injury type': injury, 'Age band': age_band}
+    cells = _select(pd.concat([cube.cells for cube in cubes], ignore_index=True), filters)
+    days = _select(pd.concat([cube.days for cube in cubes], ignore_index=True), filters)
+
+    # A constant key stands in for "no dimensions" so the grand total goes through the same groupby
+    keys = by or ['_all']
+    rolled_up = [column for column in DIMENSIONS if column not in keys]
+    totals = cells.drop(columns=rolled_up).assign(_all=0).groupby(keys, as_index=False).sum()
+    medians = _medians(days.drop(columns=rolled_up).assign(_all=0), keys)
+
+    result = totals[keys].copy()
+    result['Injuries'] = totals['Injuries'].astype('int64')
+    result['Days out total'] = totals['Days out total'].astype('int64')
+    result['Days out mean'] = totals['Days out total'] / totals['Injuries']
+    result = result.merge(medians, on=keys, how='left')
+    for measure in MEASURES:
+        n = totals[f"{measure} n"].to_numpy().astype('float64')
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = totals[f"{measure} sum"].to_numpy() / n
+            # Sample standard deviation, as pandas' std() gives
+            variance = (totals[f"{measure} sumsq"].to_numpy() - n * mean ** 2) / (n - 1)
+        result[f"{measure} mean"] = mean
+        result[f"{measure} std"] = np.sqrt(np.maximum(variance, 0))
+    result = result.drop(columns=['_all'], errors='ignore')
+    return result.sort_values('Injuries', ascending=False, kind='stable').reset_index(drop=True)
+
+# python -m injury_pipeline.cube --by Position "Age band" --sport MLB --injury "strained hamstring"
+def main():
+    parser = argparse.ArgumentParser(prog='injury_pipeline.cube', description='Roll up the injury cube.')
+    parser.add_argument('--by', nargs='*', default=[], choices=DIMENSIONS)
+    parser.add_argument('--sport', nargs='+', help='league labels, e.g. MLB NBA')
+    parser.add_argument('--season', nargs='+', type=int)
+    parser.add_argument('--position', nargs='+')
+    parser.add_argument('--injury', nargs='+', help='normalized injury labels (the Injury type column)')
+    parser.add_argument('--age-band', nargs='+', choices=AGE_BAND_LABELS + ['unknown'])
+    parser.add_argument('--cube-dir', default=CUBE_DIR)
+    args = parser.parse_args()
+    result = query_cube(args.by, args.sport, args.season, args.position, args.injury, args.age_band, args.cube_dir)
+    print(result.to_string(index=False))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+import pandas as pd
+
+# Date layouts found in the source files, tried in order:
+# scraped pages and master.csv (ISO), common_player_info.csv (ISO with time), biofile.csv (US style)
+DATE_FORMATS = ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y', '%Y%m%d']
+
+# Parse a column of dates with explicit formats instead of letting pandas guess per value
+# Values no format can read become NaT
+def parse_dates(values, formats=DATE_FORMATS):
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    strings = values.astype('string').str.strip()
+    parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    for fmt in formats:
+        missing = parsed.isna() & strings.notna()
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(strings[missing], format=fmt, errors='coerce')
+    return parsed
+
+# Whole years between birthdates and dates (e.g. age at injury), as nullable integers
+def age_at(birthdates, dates):
+    birthdates = parse_dates(birthdates)
+    dates = parse_dates(dates)
+    before_birthday = (dates.dt.month < birthdates.dt.month) | ((dates.dt.month == birthdates.dt.month) & (dates.dt.day < birthdates.dt.day))
+    return (dates.dt.year - birthdates.dt.year - before_birthday.astype('Int64')).astype('Int64')
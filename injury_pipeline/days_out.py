@@ -0,0 +1,26 @@
+import pandas as pd
+
+RETURN_NOTE = 'returned to lineup'
+# Pairings of a year or more are treated as unrelated transactions
+MAX_DAYS_OUT = 365
+
+# Pair every injury with the player's next "returned to lineup" transaction and compute the days out
+# Done as one as-of join on (Player, Date) instead of scanning each player's rows per injury.
+# Only injuries with a return 0 < days < MAX_DAYS_OUT later are kept, and when several injuries
+# share a player's return date only the one with the fewest days out survives
+# (what calculate_days_out followed by filter_least_days_out used to do per player)
+def calculate_days_out(df, player_col='Player', date_col='Date', notes_col='Notes'):
+    is_return = df[notes_col].str.contains(RETURN_NOTE, regex=False, na=False)
+
+    returns = df.loc[is_return, [player_col, date_col]].rename(columns={date_col: 'Return date'})
+    returns = returns.sort_values('Return date', kind='stable')
+    injuries = df.loc[~is_return].drop(columns=['Return date', 'Days out'], errors='ignore')
+    injuries = injuries.sort_values(date_col, kind='stable')
+
+    paired = pd.merge_asof(injuries, returns, left_on=date_col, right_on='Return date', by=player_col,
+                           direction='forward', allow_exact_matches=False)
+    paired['Days out'] = (paired['Return date'] - paired[date_col]).dt.days
+    paired = paired[(paired['Days out'] > 0) & (paired['Days out'] < MAX_DAYS_OUT)].astype({'Days out': 'int64'})
+
+    paired = paired.sort_values([player_col, 'Days out'], kind='stable')
+    return paired.drop_duplicates(subset=[player_col, 'Return date'], keep='first')
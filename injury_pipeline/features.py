@@ -0,0 +1,127 @@
+import os
+
+import pandas as pd
+
+from .frames import concat_frames, load_frame, write_frame
+
+FEATURES_DIR = 'feature_store'
+KEY_COLUMNS = ['Player', 'Injury date', 'Injury']
+# Players are told apart by their roster spelling, so every injury-list spelling of a player adds to one history
+PLAYER_COLUMN = 'Roster name'
+FEATURE_COLUMNS = ['Prior injuries', 'Prior days out', 'Days since return', 'Prior same body part']
+
+def _keys(df):
+    return pd.MultiIndex.from_arrays([df['Player'].astype(str), df['Injury date'], df['Injury'].astype(str)])
+
+def _aggregate(df):
+    player = df[PLAYER_COLUMN].astype(str)
+    players = df.groupby(player).agg(**{
+        'Injuries': ('Days out', 'size'), 'Days out': ('Days out', 'sum'),
+        'Last return': ('Return date', 'max'), 'Last injury': ('Injury date', 'max')})
+    parts = df.groupby([player, df['Body part'].astype(str).fillna('')]).size().rename('Injuries')
+    return players, parts
+
+# Per-injury history features, each counting only the player's earlier injuries:
+#   Prior injuries, Prior days out (cumulative), Days since return (from the latest earlier return;
+#   negative while still out from an earlier injury), Prior same body part
+# players/parts carry totals from injuries already in the store, so new rows continue where they left off
+def rolling_features(df, players=None, parts=None):
+    df = df.sort_values([PLAYER_COLUMN, 'Injury date', 'Return date'], kind='stable').reset_index(drop=True)
+    player = df[PLAYER_COLUMN].astype(str)
+    body_part = df['Body part'].astype(str).fillna('')
+    days = df['Days out'].astype('int64')
+
+    by_player = days.groupby(player, sort=False)
+    prior = by_player.cumcount()
+    prior_days = by_player.cumsum() - days
+    last_return = df['Return date'].groupby(player, sort=False).cummax().groupby(player, sort=False).shift()
+    same_part = days.groupby([player, body_part], sort=False).cumcount()
+
+    if players is not None and not players.empty:
+        base = players.reindex(player)
+        prior += base['Injuries'].fillna(0).astype('int64').to_numpy()
+        prior_days += base['Days out'].fillna(0).astype('int64').to_numpy()
+        last_return = pd.concat([last_return, base['Last return'].set_axis(df.index)], axis=1).max(axis=1)
+    if parts is not None and not parts.empty:
+        same_part += parts.reindex(pd.MultiIndex.from_arrays([player, body_part])).fillna(0).astype('int64').to_numpy()
+
+    return df.assign(**{
+        'Prior injuries': prior.astype('Int16'),
+        'Prior days out': prior_days.astype('Int32'),
+        'Days since return': (df['Injury date'] - last_return).dt.days.astype('Int32'),
+        'Prior same body part': same_part.astype('Int16'),
+    })
+
+# Rolling features for one sport, kept in <root>/<label>/ next to the running totals they continue from
+# players/parts are indexed by Roster name; update() takes pipeline output (new or already seen injuries)
+# and only computes features for injuries not yet in the store; a player whose new injury predates their
+# stored ones is recomputed. A store from before Roster name was kept is started over from the next update
+class FeatureStore:
+    def __init__(self, root, sport_label):
+        self.directory = os.path.join(root, sport_label)
+        self.features = self._load('features')
+        self.players = self._load('players')
+        self.parts = self._load('parts')
+        if self.players is not None and PLAYER_COLUMN not in self.players.columns:
+            self.features = self.players = self.parts = None
+        if self.players is not None:
+            self.players = self.players.set_index(PLAYER_COLUMN)
+            self.parts = self.parts.set_index([PLAYER_COLUMN, 'Body part'])['Injuries']
+        self.pending = []
+        self.added = 0
+
+    def _load(self, name):
+        return load_frame(os.path.join(self.directory, name))
+
+    def update(self, df):
+        if df.empty:
+            return
+        if self.features is not None and not self.features.empty:
+            df = df[~_keys(df).isin(_keys(self.features))]
+        if df.empty:
+            return
+
+        player = df[PLAYER_COLUMN].astype(str)
+        last_injury = self.players['Last injury'] if self.players is not None else pd.Series(dtype='datetime64[ns]')
+        earliest = df['Injury date'].groupby(player).min()
+        late = earliest.index[(earliest <= last_injury.reindex(earliest.index)).to_numpy()]
+
+        if len(late):
+            # Out-of-order history: rebuild those players from all their rows
+            stored = self.features[self.features[PLAYER_COLUMN].astype(str).isin(late)]
+            self.features = self.features.drop(stored.index)
+            self.players = self.players.drop(late)
+            self.parts = self.parts.drop(late, level=PLAYER_COLUMN)
+            df = pd.concat([stored.drop(columns=FEATURE_COLUMNS), df], ignore_index=True)
+
+        result = rolling_features(df, self.players, self.parts)
+        players, parts = _aggregate(result)
+        if self.players is None:
+            self.players, self.parts = players, parts
+        else:
+            self.players = pd.concat([self.players, players]).groupby(level=0).agg(
+                {'Injuries': 'sum', 'Days out': 'sum', 'Last return': 'max', 'Last injury': 'max'})
+            self.parts = pd.concat([self.parts, parts]).groupby(level=[0, 1]).sum()
+        self.pending.append(result)
+        self.added += len(result)
+
+    def save(self):
+        if not self.pending:
+            return
+        self.features = concat_frames(([self.features] if self.features is not None else []) + self.pending)
+        self.pending = []
+
+        os.makedirs(self.directory, exist_ok=True)
+        write_frame(self.features, os.path.join(self.directory, 'features'))
+        write_frame(self.players.rename_axis(PLAYER_COLUMN).reset_index(), os.path.join(self.directory, 'players'))
+        write_frame(self.parts.rename_axis([PLAYER_COLUMN, 'Body part']).reset_index(), os.path.join(self.directory, 'parts'))
+
+# Training rows (pipeline columns plus FEATURE_COLUMNS) for the given sport labels, read from the cached store
+def training_set(root=FEATURES_DIR, sports=None):
+    labels = sports or (sorted(os.listdir(root)) if os.path.isdir(root) else [])
+    stores = [FeatureStore(root, label) for label in labels]
+    frames = [store.features.assign(sport=label) for store, label in zip(stores, labels) if store.features is not None]
+    if not frames:
+        raise FileNotFoundError(f"No feature store for {', '.join(labels) or 'any sport'} in {root}; "
+                                f"run the pipeline with features enabled first")
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,140 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .instrument import NO_STATS
+from .parse import parse_rows
+
+# Results pages hold 25 rows; the site pages with start=0, 25, 50, ...
+PAGE_SIZE = 25
+# Number of start= offsets kept in flight at once
+DEFAULT_CONCURRENCY = 8
+# Upper bound on simultaneous requests to a single host, shared by every fetcher in the process
+DEFAULT_HOST_LIMIT = 4
+
+_host_limits = {}
+_host_semaphores = {}
+_host_lock = threading.Lock()
+
+# Override the concurrency limit for one host (e.g. 'www.prosportstransactions.com')
+def set_host_limit(host, limit):
+    with _host_lock:
+        _host_limits[host] = limit
+        _host_semaphores[host] = threading.BoundedSemaphore(limit)
+
+# Use an externally created semaphore for one host, e.g. a multiprocessing.Manager semaphore so that
+# several processes share one request budget
+def share_host_limit(host, semaphore):
+    with _host_lock:
+        _host_semaphores[host] = semaphore
+
+def _host_semaphore(url):
+    host = urlsplit(url).netloc
+    with _host_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(_host_limits.get(host, DEFAULT_HOST_LIMIT))
+        return _host_semaphores[host]
+
+# Session with a connection pool sized for the worker count and retries on throttling/server errors
+# retry_throttled=False leaves 429 responses to the caller (e.g. an AdaptiveTokenBucket)
+def make_session(pool_size=DEFAULT_CONCURRENCY, retry_throttled=True):
+    statuses = [429, 500, 502, 503, 504] if retry_throttled else [500, 502, 503, 504]
+    retry = Retry(total=3, backoff_factor=1, status_forcelist=statuses, respect_retry_after_header=retry_throttled)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# Fetches paginated search results, optionally through a PageCache
+# incremental: only re-fetch pages at or after the newest cached Date
+# offline: never touch the network; a cache miss reads as the end of the results
+# With neither, every page is fetched again (--full); the cache is still refreshed with what comes back
+# parse_pool: an executor (see parse.make_parse_pool) that parses pages off the fetching threads
+# stats: a RunStats that gets the fetch/parse timings and the request, retry and cache counters
+class PageFetcher:
+    def __init__(self, session=None, concurrency=DEFAULT_CONCURRENCY, timeout=30, cache=None, incremental=False, offline=False, parse_pool=None, stats=NO_STATS):
+        self.concurrency = max(1, concurrency)
+        self.session = session or make_session(self.concurrency)
+        self.timeout = timeout
+        self.cache = cache
+        self.incremental = incremental
+        self.offline = offline
+        self.parse_pool = parse_pool
+        self.stats = stats
+
+    # Download one page, waiting for a free slot on its host
+    def get(self, url):
+        with _host_semaphore(url), self.stats.stage('fetch'):
+            response = self.session.get(url, timeout=self.timeout)
+        self.stats.count('http_requests')
+        # urllib3 keeps the retries it made for this response (429s and server errors)
+        retries = getattr(response.raw, 'retries', None)
+        if retries is not None and retries.history:
+            self.stats.count('http_retries', len(retries.history))
+        response.raise_for_status()
+        return response.text
+
+    def _parse(self, parse, html):
+        with self.stats.stage('parse') as stage:
+            if self.parse_pool is not None:
+                rows = self.parse_pool.submit(parse, html).result()
+            else:
+                rows = parse(html)
+            stage.rows_out = len(rows)
+        return rows
+
+    def _fetch_page(self, base_url, offset, parse, frontier):
+        url = f"{base_url}{offset}"
+        if self.cache is not None and (self.incremental or self.offline):
+            html = self.cache.get(url, incremental=self.incremental, frontier=frontier, stale_ok=self.offline)
+            if html is not None:
+                self.stats.count('cache_hits')
+                return self._parse(parse, html)
+            self.stats.count('cache_misses')
+        if self.offline:
+            return []
+        html = self.get(url)
+        rows = self._parse(parse, html)
+        if self.cache is not None and rows:
+            self.cache.put(url, html, rows)
+        return rows
+
+    # Yield (offset, rows) for each results page in page order, stopping at the first empty page
+    # Up to `concurrency` offsets are requested ahead of the page currently being yielded
+    def iter_pages(self, base_url, parse=parse_rows, start=0, increment=PAGE_SIZE):
+        frontier = None
+        if self.cache is not None and self.incremental:
+            frontier = self.cache.newest_date(f"{base_url}{start}")
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            pending = deque()
+            next_offset = start
+            try:
+                while True:
+                    while len(pending) < self.concurrency:
+                        pending.append((next_offset, pool.submit(self._fetch_page, base_url, next_offset, parse, frontier)))
+                        next_offset += increment
+                    offset, future = pending.popleft()
+                    rows = future.result()
+                    if not rows:
+                        break
+                    yield offset, rows
+            finally:
+                # Pages past the end (or left over after an error) are not needed
+                for _, future in pending:
+                    future.cancel()
+                if self.cache is not None:
+                    self.cache.save()
+
+    # All rows of a paginated search, in page order
+    def fetch_all(self, base_url, parse=parse_rows, start=0, increment=PAGE_SIZE):
+        all_data = []
+        for _, rows in self.iter_pages(base_url, parse, start, increment):
+            all_data.extend(rows)
+        return all_data
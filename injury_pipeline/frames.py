@@ -0,0 +1,42 @@
+import os
+
+import pandas as pd
+
+# Stored frames are Parquet, or a pickle when no Parquet engine is installed
+FRAME_EXTENSIONS = ('.parquet', '.pkl')
+
+# Write df to path + '.parquet' (or '.pkl') and return the file written
+def write_frame(df, path):
+    try:
+        df.to_parquet(path + '.parquet', index=False)
+        return path + '.parquet'
+    except ImportError:
+        # No parquet engine installed; a pickle still keeps the dtypes
+        df.to_pickle(path + '.pkl')
+        return path + '.pkl'
+
+def read_frame(path):
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+# The frame stored under path (without extension) by write_frame, or None if there is none
+def load_frame(path):
+    for ext in FRAME_EXTENSIONS:
+        if os.path.exists(path + ext):
+            return read_frame(path + ext)
+    return None
+
+# Delete the frame stored under path, whichever format it was written in
+def remove_frame(path):
+    for ext in FRAME_EXTENSIONS:
+        if os.path.exists(path + ext):
+            os.remove(path + ext)
+
+# pd.concat that keeps categorical columns categorical
+# concat falls back to plain objects when the frames' categories differ, so those columns are cast back
+def concat_frames(frames):
+    frames = list(frames)
+    combined = pd.concat(frames, ignore_index=True)
+    categorical = {column for frame in frames for column in frame.columns if isinstance(frame[column].dtype, pd.CategoricalDtype)}
+    return combined.astype({column: 'category' for column in categorical if column in combined.columns})
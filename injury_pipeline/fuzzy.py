@@ -0,0 +1,110 @@
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+from .names import format_player_name
+
+# Minimum similarity (0-1) for a fuzzy match to be accepted
+DEFAULT_THRESHOLD = 0.85
+# Candidates kept from the n-gram index when the name block is empty
+NGRAM_CANDIDATES = 10
+
+SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+# Common short forms of first names, mapped to one spelling so "Mike" and "Michael" block together
+NICKNAMES = {
+    'mike': 'michael', 'matt': 'matthew', 'chris': 'christopher', 'alex': 'alexander', 'tony': 'anthony',
+    'nick': 'nicholas', 'joe': 'joseph', 'jon': 'jonathan', 'dan': 'daniel', 'danny': 'daniel',
+    'rob': 'robert', 'bob': 'robert', 'bobby': 'robert', 'bill': 'william', 'will': 'william',
+    'jim': 'james', 'jimmy': 'james', 'tom': 'thomas', 'dave': 'david', 'steve': 'steven',
+    'pat': 'patrick', 'ben': 'benjamin', 'josh': 'joshua', 'zach': 'zachary', 'andy': 'andrew',
+    'drew': 'andrew', 'tim': 'timothy', 'greg': 'gregory', 'jeff': 'jeffrey', 'ed': 'edward',
+    'rick': 'richard', 'rich': 'richard', 'ron': 'ronald', 'sam': 'samuel', 'jake': 'jacob',
+    'nate': 'nathan', 'fred': 'frederick', 'charlie': 'charles', 'ken': 'kenneth', 'kenny': 'kenneth',
+}
+
+# Name reduced for fuzzy comparison: accents and punctuation dropped, suffixes removed,
+# first name mapped through NICKNAMES ("José Ramírez Jr." -> ['jose', 'ramirez'])
+def fuzzy_tokens(name):
+    if not isinstance(name, str):
+        return []
+    name = format_player_name(name)
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii').lower()
+    name = re.sub(r"[.'`]", '', name)
+    tokens = [token for token in re.sub(r'[^a-z]+', ' ', name).split() if token not in SUFFIXES]
+    if tokens:
+        tokens[0] = NICKNAMES.get(tokens[0], tokens[0])
+    return tokens
+
+def _block_key(tokens):
+    return (tokens[-1], tokens[0][0]) if tokens else None
+
+def _ngrams(text, n=3):
+    padded = f"  {text} "
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+# Fuzzy matcher for names the exact/substring lookups missed
+# Candidates come from a (last name, first initial) block; when that block is empty, from a
+# character trigram index. Only those candidates are scored, never the whole roster
+class FuzzyNameMatcher:
+    def __init__(self, roster_names, threshold=DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.roster_names = list(roster_names)
+        self.keys = []
+        self.blocks = defaultdict(list)
+        self.ngram_index = defaultdict(list)
+        for position, name in enumerate(self.roster_names):
+            tokens = fuzzy_tokens(name)
+            key = ' '.join(tokens)
+            self.keys.append(key)
+            if not tokens:
+                continue
+            self.blocks[_block_key(tokens)].append(position)
+            for gram in _ngrams(key):
+                self.ngram_index[gram].append(position)
+
+    def _candidates(self, tokens, key):
+        block = self.blocks.get(_block_key(tokens))
+        if block:
+            return block, 'name'
+        shared = defaultdict(int)
+        for gram in _ngrams(key):
+            for position in self.ngram_index.get(gram, ()):
+                shared[position] += 1
+        ranked = sorted(shared, key=lambda position: (-shared[position], position))
+        return ranked[:NGRAM_CANDIDATES], 'ngram'
+
+    # Best roster row position for one name (or None) plus its audit record
+    def match(self, name):
+        tokens = fuzzy_tokens(name)
+        key = ' '.join(tokens)
+        best, best_score, method = None, 0.0, ''
+        if tokens:
+            candidates, method = self._candidates(tokens, key)
+            for position in candidates:
+                score = SequenceMatcher(None, key, self.keys[position]).ratio()
+                if score > best_score or (score == best_score and best is not None and position < best):
+                    best, best_score = position, score
+        accepted = best is not None and best_score >= self.threshold
+        audit = {
+            'Name': name,
+            'Candidate': self.roster_names[best] if best is not None else None,
+            'Score': round(best_score, 3),
+            'Block': method,
+            'Accepted': accepted,
+        }
+        return (best if accepted else None), audit
+
+    # Row positions for many names (None where nothing cleared the threshold) and an audit frame
+    # listing the best candidate found for every name, accepted or not
+    def match_many(self, names):
+        positions = []
+        audit = []
+        for name in names:
+            position, record = self.match(name)
+            positions.append(position)
+            audit.append(record)
+        return positions, pd.DataFrame(audit, columns=['Name', 'Candidate', 'Score', 'Block', 'Accepted'])
@@ -0,0 +1,96 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Status tags stripped from every injury note
+STATUS_TAGS_RE = re.compile(r'\s*\((?:DNP|DTD|out indefinitely)\)', re.I)
+
+# Incomplete list of injuries not to be looked at, could be added to
+# Each term matches as a whole word, plural allowed ('illness' -> 'illnesses'), unless marked as a prefix
+# ('COVID' -> 'COVID-19'), a suffix ('itis' -> 'tendinitis') or a verb ('rest' -> 'rests', 'rested', 'resting'),
+# so 'rest' no longer catches 'wrest' or 'forest' and 'cold' no longer catches 'scolded'
+# 'conditioning' also catches 'reconditioning' and 'eye' every eye-area note ('eyelid', 'eyebrow'), as the
+# substring matching did; 'influenza' is listed because 'flu' only matches the whole word
+EXCLUDED_INJURIES = [
+    ('ingrown', 'prefix'), ('flu', 'word'), ('influenza', 'word'), ('itis', 'suffix'), ('illness', 'word'),
+    ('cold', 'word'), ('rest', 'verb'), ('food', 'word'), ('headache', 'word'), ('sinus', 'prefix'),
+    ('virus', 'suffix'), ('viral', 'word'), ('infection', 'word'), ('COVID', 'prefix'), ('NBA', 'word'),
+    ('tooth', 'prefix'), ('conditioning', 'suffix'), ('hernia', 'word'), ('kidney stones', 'word'),
+    ('fatigue', 'word'), ('eye', 'prefix'), ('undisclosed', 'word'), ('throat', 'word'),
+]
+
+# Body part label -> words that name it in the notes
+BODY_PARTS = {
+    'ankle': ['ankle'], 'knee': ['knee', 'acl', 'mcl', 'meniscus', 'patella', 'patellar'],
+    'hamstring': ['hamstring'], 'quad': ['quad', 'quadriceps'], 'calf': ['calf'], 'achilles': ['achilles'],
+    'foot': ['foot', 'plantar', 'heel', 'toe', 'arch'], 'shin': ['shin', 'tibia', 'fibula'],
+    'hip': ['hip'], 'groin': ['groin', 'adductor'], 'leg': ['leg', 'thigh'],
+    'back': ['back', 'lumbar', 'spine', 'spinal'], 'neck': ['neck'], 'head': ['head', 'concussion', 'face', 'nose', 'jaw'],
+    'shoulder': ['shoulder', 'rotator', 'labrum'], 'elbow': ['elbow', 'ucl', 'tommy john'],
+    'arm': ['arm', 'biceps', 'triceps', 'forearm', 'lat'], 'wrist': ['wrist'],
+    'hand': ['hand', 'finger', 'thumb', 'knuckle'], 'chest': ['chest', 'pectoral', 'rib', 'ribs'],
+    'core': ['oblique', 'abdominal', 'abdomen', 'side', 'intercostal'],
+}
+
+def _term_pattern(term, kind):
+    term = re.escape(term)
+    if kind == 'prefix':
+        return rf'\b{term}\w*'
+    if kind == 'suffix':
+        return rf'\w*{term}\b'
+    if kind == 'verb':
+        return rf'\b{term}(?:e?s|ed|ing)?\b'
+    return rf'\b{term}(?:e?s)?\b'
+
+EXCLUDE_RE = re.compile('|'.join(_term_pattern(term, kind) for term, kind in EXCLUDED_INJURIES), re.I)
+_BODY_PART_BY_WORD = {word: part for part, words in BODY_PARTS.items() for word in words}
+BODY_PART_RE = re.compile(r'\b(' + '|'.join(sorted(map(re.escape, _BODY_PART_BY_WORD), key=len, reverse=True)) + r')\b', re.I)
+
+# Wording stripped from the injury label so the same injury always gets the same label (it is a cube dimension):
+# the placement prefix and "recovering from", a leading article, parenthesised asides, "left game" at either end
+# and a side word right before a body part ("right ankle" -> "ankle", but "left game" is not a side)
+PLACEMENT_RE = re.compile(r'^(?:(?:placed on (?:\d+-day )?(?:IL|DL|IR|injured (?:list|reserve))|activated from IL'
+                          r'|(?:left|exited) (?:the )?game)(?: with)?|out with|recovering from)\b\s*|^(?:a|an|the)\s+', re.I)
+ASIDE_RE = re.compile(r'\([^)]*\)')
+LEFT_GAME_RE = re.compile(r'[\s,;-]*\b(?:left|exited) (?:the )?game\s*$', re.I)
+SIDE_RE = re.compile(r'\b(?:left|right)\s+(?=' + BODY_PART_RE.pattern + ')', re.I)
+
+# Injury note (status tags already removed) -> lowercase injury label, or None when nothing is left
+def injury_label(note):
+    label = note.lower()
+    while True:
+        stripped = PLACEMENT_RE.sub('', label, count=1)
+        if stripped == label:
+            break
+        label = stripped
+    # An aside that is the whole label ("(undisclosed)") is kept without its brackets
+    label = ASIDE_RE.sub(' ', label).strip() or label.strip('() ')
+    label = SIDE_RE.sub('', LEFT_GAME_RE.sub('', label))
+    return ' '.join(label.split()).strip(' ,;-') or None
+
+# One injury note -> (cleaned note, injury label, body part, include flag)
+def classify_injury(note):
+    if not isinstance(note, str):
+        return note, None, None, True
+    cleaned = STATUS_TAGS_RE.sub('', note).strip()
+    label = injury_label(cleaned)
+    body_part = BODY_PART_RE.search(cleaned)
+    body_part = _BODY_PART_BY_WORD[body_part.group(1).lower()] if body_part else None
+    return cleaned, label, body_part, EXCLUDE_RE.search(cleaned) is None
+
+# Classify a column of injury notes
+# Each distinct note is classified once and the results are broadcast back through its factorized code,
+# so the cost depends on the number of distinct notes rather than rows
+# Returns Injury (status tags removed), Injury type and Body part as categoricals, and a boolean Include
+def classify_injuries(notes):
+    codes, uniques = pd.factorize(notes)
+    # The extra last slot is picked up by code -1 (missing notes)
+    results = [classify_injury(note) for note in uniques] + [classify_injury(None)]
+    cleaned, labels, body_parts, include = (np.array(column, dtype=object) for column in zip(*results))
+    return pd.DataFrame({
+        'Injury': pd.Categorical(cleaned[codes]),
+        'Injury type': pd.Categorical(labels[codes]),
+        'Body part': pd.Categorical(body_parts[codes]),
+        'Include': include[codes].astype(bool),
+    }, index=notes.index)
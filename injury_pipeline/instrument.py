@@ -0,0 +1,121 @@
+import cProfile
+import json
+import pstats
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Peak resident memory of this process in MB (None where the resource module is missing, e.g. Windows)
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return round(peak / (1 << 20 if sys.platform == 'darwin' else 1 << 10), 1)
+
+class Stage:
+    def __init__(self, stats, name, rows_in):
+        self.stats = stats
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.profiler = None
+
+    def __enter__(self):
+        if self.name == self.stats.profile_stage and self.stats._start_profiling():
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.wall
+        cpu = time.thread_time() - self.cpu
+        if self.profiler is not None:
+            self.profiler.disable()
+        self.stats._add(self, wall, cpu)
+
+class _NoStage:
+    rows_out = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+# Timings and counters for one pipeline run, shared by every thread of it
+# stage(name, rows_in) times a block (wall and CPU time of the calling thread); set .rows_out on the
+# returned object to record what came out. Stages run from several threads at once (fetch, parse) add up
+# their calls, so their wall time is busy time, not elapsed time
+# count(name, n) bumps a counter (cache hits, HTTP retries, unmatched players, ...)
+# profile_stage: name of one stage to run under cProfile; its stats are saved to profile_path by save_profile()
+class RunStats:
+    def __init__(self, enabled=True, profile_stage=None, profile_path=None):
+        self.enabled = enabled
+        self.profile_stage = profile_stage
+        self.profile_path = profile_path
+        self.stages = {}
+        self.counters = {}
+        self.profiles = []
+        self._profiling = False
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def stage(self, name, rows_in=None):
+        if not self.enabled:
+            return _NoStage()
+        return Stage(self, name, rows_in)
+
+    def _add(self, stage, wall, cpu):
+        with self._lock:
+            entry = self.stages.setdefault(stage.name, {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'rows_in': 0, 'rows_out': 0})
+            entry['calls'] += 1
+            entry['wall_seconds'] += wall
+            entry['cpu_seconds'] += cpu
+            entry['rows_in'] += stage.rows_in or 0
+            entry['rows_out'] += stage.rows_out or 0
+            if stage.profiler is not None:
+                self.profiles.append(stage.profiler)
+                self._profiling = False
+
+    # Only one profiler can run at a time, so concurrent calls of the profiled stage after the first go unprofiled
+    def _start_profiling(self):
+        with self._lock:
+            if self._profiling:
+                return False
+            self._profiling = True
+            return True
+
+    def count(self, name, n=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def summary(self, **extra):
+        stages = {name: {**entry, 'wall_seconds': round(entry['wall_seconds'], 4), 'cpu_seconds': round(entry['cpu_seconds'], 4)}
+                  for name, entry in self.stages.items()}
+        return {**extra, 'wall_seconds': round(time.perf_counter() - self.started, 3), 'peak_rss_mb': peak_rss_mb(),
+                'stages': stages, 'counters': dict(self.counters)}
+
+    # JSON run summary at `path`
+    def write(self, path, **extra):
+        with open(path, 'w') as f:
+            json.dump(self.summary(**extra), f, indent=2)
+
+    # pstats file of the profiled stage (readable with python -m pstats); False if that stage never ran
+    def save_profile(self):
+        if not self.profiles or not self.profile_path:
+            return False
+        pstats.Stats(*self.profiles).dump_stats(self.profile_path)
+        return True
+
+# Collector that records nothing; the default wherever no run statistics are wanted
+NO_STATS = RunStats(enabled=False)
@@ -0,0 +1,48 @@
+from .fuzzy import FuzzyNameMatcher
+from .names import PlayerNameIndex
+
+# Name-matching strategies used by the sport plugins
+# Each is built once over the roster's names; match(names) returns one roster row position per
+# name (None when unmatched) and the fuzzy matcher's audit frame for the names that needed it
+
+# First roster row whose cleaned name contains the injury-list name, then fuzzy matching
+class SubstringThenFuzzy:
+    def __init__(self, roster_names):
+        self.index = PlayerNameIndex(roster_names)
+        self.fuzzy = FuzzyNameMatcher(roster_names)
+
+    def match(self, names):
+        positions = self.index.resolve_many(names)
+        return _fill_with_fuzzy(self.fuzzy, names, positions)
+
+# Exact roster name, then fuzzy matching
+class ExactThenFuzzy:
+    def __init__(self, roster_names):
+        self.exact = {}
+        for position, name in enumerate(roster_names):
+            self.exact.setdefault(name, position)
+        self.fuzzy = FuzzyNameMatcher(roster_names)
+
+    def match(self, names):
+        positions = [self.exact.get(name) for name in names]
+        return _fill_with_fuzzy(self.fuzzy, names, positions)
+
+def _fill_with_fuzzy(fuzzy, names, positions):
+    unmatched = [i for i, position in enumerate(positions) if position is None]
+    fuzzy_positions, audit = fuzzy.match_many([names[i] for i in unmatched])
+    for i, position in zip(unmatched, fuzzy_positions):
+        positions[i] = position
+    return positions, audit
+
+# Remembers the answers of another matcher, for callers that match the same names chunk after chunk
+# (streamed windows); the audit frame only covers names it had not seen before
+class MemoMatcher:
+    def __init__(self, matcher):
+        self.matcher = matcher
+        self.positions = {}
+
+    def match(self, names):
+        new_names = [name for name in dict.fromkeys(names) if name not in self.positions]
+        positions, audit = self.matcher.match(new_names)
+        self.positions.update(zip(new_names, positions))
+        return [self.positions[name] for name in names], audit
@@ -0,0 +1,70 @@
+import re
+from bisect import bisect_left
+
+import pandas as pd
+
+# Strip parenthesised text and anything up to a slash ("Old Name / New Name (Jr.)" -> "New Name")
+def format_player_name(player_name):
+    # Remove text within parentheses and the parentheses themselves
+    player_name = re.sub(r'\s*\(.*?\)', '', player_name)
+    # Remove the part before the slash and the slash itself
+    player_name = re.sub(r'.*\/\s*', '', player_name)
+    return player_name.strip()
+
+# Column-wide format_player_name, lowercased for case-insensitive lookups
+def normalize_names(names):
+    names = pd.Series(names, dtype=object).fillna('').astype(str)
+    names = names.str.replace(r'\s*\(.*?\)', '', regex=True).str.replace(r'.*\/\s*', '', regex=True)
+    return names.str.strip().str.lower()
+
+# Lookup structure over a roster's player names, built once
+# A name resolves to the first roster row whose cleaned name contains it (case-insensitive),
+# as the old per-player str.contains scan did:
+#   - exact cleaned names hit a dict, which bounds the search for an earlier containing row
+#   - multi-word names are narrowed through a sorted token list: in any containing roster name the
+#     last word of the query starts a word, so a prefix search over tokens finds every candidate
+#   - single words that are not a whole name fall back to a scan of the cleaned column
+class PlayerNameIndex:
+    def __init__(self, roster_names):
+        self.names = normalize_names(roster_names).tolist()
+        self.exact = {}
+        tokens = []
+        for position, name in enumerate(self.names):
+            self.exact.setdefault(name, position)
+            for token in set(name.split()):
+                tokens.append((token, position))
+        tokens.sort()
+        self.tokens = [token for token, _ in tokens]
+        self.token_rows = [position for _, position in tokens]
+
+    def _rows_with_token_prefix(self, prefix):
+        rows = set()
+        i = bisect_left(self.tokens, prefix)
+        while i < len(self.tokens) and self.tokens[i].startswith(prefix):
+            rows.add(self.token_rows[i])
+            i += 1
+        return rows
+
+    # Roster row position for one injury-list name, or None
+    def resolve(self, player_name):
+        query = format_player_name(player_name).lower()
+        if not query:
+            return None
+        # An exact match is the answer unless an earlier row contains the name as well
+        best = self.exact.get(query)
+
+        words = query.split()
+        if len(words) > 1:
+            candidates = sorted(self._rows_with_token_prefix(words[-1]))
+        else:
+            candidates = range(len(self.names) if best is None else best)
+        for position in candidates:
+            if best is not None and position >= best:
+                break
+            if query in self.names[position]:
+                return position
+        return best
+
+    # Row positions for many names at once (None where nothing matches)
+    def resolve_many(self, player_names):
+        return [self.resolve(name) for name in player_names]
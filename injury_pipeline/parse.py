@@ -0,0 +1,102 @@
+import html as html_lib
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+# Raised by the fast extractors when a page does not look like they expect; parse_rows then uses BeautifulSoup
+class UnexpectedMarkup(ValueError):
+    pass
+
+# Normalize one results row to [Date, Team, Player, Notes]
+# Five-column rows carry the player in either the third or fourth cell, whichever is filled
+def normalize_row(cols):
+    if len(cols) == 5:
+        if cols[2] == '':
+            return [cols[0], cols[1], cols[3], cols[4]]
+        return [cols[0], cols[1], cols[2], cols[4]]
+    if len(cols) == 4:
+        return [cols[0], cols[1], cols[2], cols[3]]
+    return None
+
+def _normalize_rows(rows):
+    data = []
+    for cols in rows:
+        normalized = normalize_row(cols)
+        if normalized is not None:
+            data.append(normalized)
+    return data
+
+# Reference extractor: full BeautifulSoup tree with the pure-Python parser
+def parse_rows_bs4(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.find('table', {'class': 'datatable'})
+    if table is None:
+        return []
+    rows = [[ele.text.strip() for ele in row.find_all('td')] for row in table.find_all('tr')[1:]]
+    return _normalize_rows(rows)
+
+_TABLE_RE = re.compile(r'<table\b[^>]*\bclass\s*=\s*["\']?[^"\'>]*\bdatatable\b[^>]*>(.*?)</table\s*>', re.I | re.S)
+_ROW_RE = re.compile(r'<tr\b[^>]*>(.*?)(?=<tr\b|$)', re.I | re.S)
+_CELL_RE = re.compile(r'<td\b[^>]*>(.*?)</td\s*>', re.I | re.S)
+_TAG_RE = re.compile(r'<[^>]*>')
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.S)
+
+# Fast extractor: regular expressions over the datatable markup only, no tree
+# Gives up (UnexpectedMarkup) on anything it cannot read the way BeautifulSoup would:
+# nested tables, unclosed cells, comments or scripts inside the table
+def parse_rows_regex(html):
+    match = _TABLE_RE.search(html)
+    if match is None:
+        if 'datatable' in html:
+            raise UnexpectedMarkup('datatable present but not matched')
+        return []
+    body = match.group(1)
+    if re.search(r'<table\b|<script\b|<!--', body, re.I):
+        raise UnexpectedMarkup('nested markup inside datatable')
+
+    rows = []
+    for row in _ROW_RE.findall(body)[1:]:
+        cells = _CELL_RE.findall(row)
+        if len(cells) != len(re.findall(r'<td\b', row, re.I)):
+            raise UnexpectedMarkup('unclosed cell')
+        rows.append([html_lib.unescape(_TAG_RE.sub('', cell)).strip() for cell in cells])
+    return _normalize_rows(rows)
+
+# Fast extractor backed by lxml's C parser (only when lxml is installed)
+def parse_rows_lxml(html):
+    if lxml is None:
+        raise UnexpectedMarkup('lxml is not installed')
+    document = lxml.html.fromstring(html)
+    tables = document.xpath('//table[contains(concat(" ", normalize-space(@class), " "), " datatable ")]')
+    if not tables:
+        return []
+    rows = [[cell.text_content().strip() for cell in row.iter('td')] for row in tables[0].iter('tr')]
+    return _normalize_rows(rows[1:])
+
+BACKENDS = {
+    'bs4': parse_rows_bs4,
+    'regex': parse_rows_regex,
+    'lxml': parse_rows_lxml,
+}
+DEFAULT_BACKEND = 'lxml' if lxml is not None else 'regex'
+
+# Pull the rows out of a prosportstransactions results page
+# Returns an empty list when the page has no datatable (past the last page)
+# The chosen backend is tried first; BeautifulSoup is the fallback whenever it fails
+def parse_rows(html, backend=DEFAULT_BACKEND):
+    if backend != 'bs4':
+        try:
+            return BACKENDS[backend](html)
+        except Exception:
+            pass
+    return parse_rows_bs4(html)
+
+# Process pool for parsing, so page parsing is spread across cores (pass it to PageFetcher)
+def make_parse_pool(processes=None):
+    return ProcessPoolExecutor(max_workers=processes)
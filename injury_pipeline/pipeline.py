@@ -0,0 +1,200 @@
+import os
+from datetime import datetime
+from functools import partial
+
+import pandas as pd
+
+from .cache import PageCache
+from .dates import age_at
+from .changes import CHANGES_DIR, ChangeTracker
+from .cube import CUBE_DIR, InjuryCube
+from .days_out import calculate_days_out
+from .features import FEATURES_DIR, FeatureStore
+from .fetch import PageFetcher
+from .injuries import classify_injuries
+from .instrument import NO_STATS, RunStats
+from .matching import MemoMatcher
+from .schema import OUTPUT_SCHEMA, ROSTER_SCHEMA, apply_schema
+from .shards import iter_sharded, scrape_sharded, source_dir
+from .sports import SOURCE, get_sport
+from .store import STORE_DIR, DatasetWriter
+from .stream import InjuryBuffer, clean_rows, iter_settled, settled_only, write_incrementally
+
+OUTPUT_COLUMNS = ['Player', 'Roster name', 'Position', 'Injury', 'Injury date', 'Return date', 'Days out', 'Height', 'Weight', 'Age', 'Injury type', 'Body part']
+
+# Cross-reference player details and compute days out for one chunk of injuries
+# (a chunk holds every row of its players from its first injury up to MAX_DAYS_OUT after its last);
+# fuzzy audit frames are collected in `audits`
+# With max_age set, only injuries suffered before that age are kept
+# reported: set of unmatched names already reported by earlier chunks, so each is reported once
+def process_injuries(df_injuries, roster, matcher, audits, max_age=None, stats=NO_STATS, reported=None):
+    injured_players = list(df_injuries['Player'].unique())
+    with stats.stage('match', len(injured_players)) as stage:
+        positions, audit = matcher.match(injured_players)
+        stage.rows_out = sum(position is not None for position in positions)
+    audits.append(audit)
+
+    player_details = []
+    for player_name, position in zip(injured_players, positions):
+        if position is None:
+            if reported is None or player_name not in reported:
+                print(f"No details found for player: {player_name}")
+                stats.count('unmatched_players')
+            if reported is not None:
+                reported.add(player_name)
+        else:
+            player_details.append((player_name, position))
+
+    if not player_details:
+        return apply_schema(pd.DataFrame(columns=OUTPUT_COLUMNS), OUTPUT_SCHEMA)
+
+    # Roster rows keyed by the injury-list spelling of each name so the merge lines up;
+    # the roster's own spelling stays on as Roster name, the player's identity for the feature store and scoring
+    names, positions = zip(*player_details)
+    df_player_details = roster.iloc[list(positions)].rename(columns={'Player': 'Roster name'}).assign(Player=list(names))
+    merged_data = pd.merge(df_injuries, df_player_details, on='Player', how='inner')
+
+    # Age at the injury date, computed on the whole column
+    merged_data['Age'] = age_at(merged_data['DOB'], merged_data['Date'])
+    if max_age is not None:
+        # An unknown age (missing DOB) does not pass
+        merged_data = merged_data[(merged_data['Age'] < max_age).fillna(False).astype(bool)]
+    merged_data.sort_values(['Player', 'Date'], inplace=True)
+
+    # Pair injuries with returns; keeps only injuries with a return date, the shortest per player and return date
+    with stats.stage('days_out', len(merged_data)) as stage:
+        merged_data = calculate_days_out(merged_data)
+        stage.rows_out = len(merged_data)
+    merged_data = merged_data.rename(columns={'Notes': 'Injury', 'Date': 'Injury date'})
+
+    # Strip status tags, label injury type and body part, and drop excluded injuries in one pass
+    with stats.stage('filter', len(merged_data)) as stage:
+        labels = classify_injuries(merged_data['Injury'])
+        merged_data = merged_data.assign(**{column: labels[column] for column in labels.columns})
+        merged_data = merged_data[merged_data['Include']]
+        stage.rows_out = len(merged_data)
+
+    return apply_schema(merged_data[OUTPUT_COLUMNS], OUTPUT_SCHEMA)
+
+# Feed every processed chunk to the feature store / change tracker as well
+def _updating(process, *trackers):
+    def process_and_update(chunk):
+        result = process(chunk)
+        for tracker in trackers:
+            tracker.update(result)
+        return result
+    return process_and_update
+
+# Fold this run's delta into the cube when the cube is at the delta just before it; a cube that is missing
+# or out of step with the change manifest is rebuilt from the tracker's records instead
+def _update_cube(cube, changes, delta, stats=NO_STATS):
+    sequence = changes.sequence()
+    if delta is not None and cube.sequence == delta['sequence'] - 1:
+        with stats.stage('cube', len(changes.added) + len(changes.removed)):
+            cube.apply(changes.added, changes.removed)
+            cube.save(sequence)
+    elif cube.sequence != sequence:
+        records = changes.records()
+        with stats.stage('cube', 0 if records is None else len(records)):
+            cube.rebuild(records)
+            cube.save(sequence)
+        print(f"{cube.sport_label} cube rebuilt at change {sequence}")
+
+# Full pipeline for one sport: scrape (cached, sharded), match against the roster, compute days out and
+# write the result to the columnar store (store_dir, partitioned by sport and season) and/or
+# Merged_<label>_Player_Injuries_with_details.csv in output_dir
+# incremental: only re-fetch pages after the newest cached date; offline: rerun from the page cache alone
+# streaming: process each year of injuries while the crawl goes on, as soon as every shard before it has finished,
+# and append to the outputs as it goes; memory stays at about two years of rows
+# source: site serving the search pages (a local stand-in for offline testing)
+# features_dir: rolling per-player features are updated there with the injuries not seen before
+# changes_dir: write what changed since the previous run (inserted, updated, deleted records) as a delta there
+# cube_dir: aggregate cube kept up to date from those deltas (needs changes_dir)
+# summary: write per-stage timings, counters and peak memory to <label>_run_summary.json in output_dir
+# profile_stage: run one stage ('fetch', 'parse', 'roster', 'match', 'days_out', 'filter', 'write', 'cube') under
+# cProfile and save its stats to <label>_<stage>.prof in output_dir
+def run_sport(name, begin='2005-01-01', end='2024-12-31', start_date=None, incremental=True, offline=False,
+              streaming=True, workers=4, concurrency=4, output_dir='.', source=SOURCE, store_dir=STORE_DIR, csv=True,
+              features_dir=FEATURES_DIR, changes_dir=CHANGES_DIR, cube_dir=CUBE_DIR, summary=True,
+              profile_stage=None):
+    sport = get_sport(name)
+    base_url = sport.search_url(begin, end, source)
+    start_date = datetime.fromisoformat(start_date or begin)
+    os.makedirs(output_dir, exist_ok=True)
+    profile_path = os.path.join(output_dir, f"{sport.label}_{profile_stage}.prof") if profile_stage else None
+    stats = RunStats(enabled=summary or profile_stage is not None, profile_stage=profile_stage, profile_path=profile_path)
+    # Created up front so a missing Parquet engine fails before the scrape, not after
+    dataset = DatasetWriter(store_dir, sport.label, sport.season_start_month) if store_dir else None
+
+    fetcher = PageFetcher(concurrency=concurrency, cache=PageCache(os.path.join('page_cache', sport.name)), incremental=incremental, offline=offline, stats=stats)
+    checkpoint_dir = os.path.join('checkpoints', source_dir(base_url), sport.name)
+    if streaming:
+        pages = iter_sharded(fetcher, base_url, checkpoint_dir, workers=workers, season_start_month=sport.season_start_month)
+        injury_buffer = InjuryBuffer(os.path.join('injury_buffer', sport.name), start_date)
+        injury_chunks = iter_settled(pages, injury_buffer, start_date)
+    else:
+        all_data = scrape_sharded(fetcher, base_url, checkpoint_dir, workers=workers, season_start_month=sport.season_start_month)
+        df_injuries = clean_rows(all_data, start_date)
+        print(f"Found {len(df_injuries)} {sport.label} injury records")
+        injury_chunks = [df_injuries]
+
+    with stats.stage('roster') as stage:
+        roster = apply_schema(sport.load_roster(), ROSTER_SCHEMA)
+        matcher = sport.matcher(roster['Player'])
+        stage.rows_out = len(roster)
+    audits = []
+    reported = None
+    if streaming:
+        # Players show up in several windows; match and report each name once
+        matcher = MemoMatcher(matcher)
+        reported = set()
+
+    csv_path = os.path.join(output_dir, f"Merged_{sport.label}_Player_Injuries_with_details.csv") if csv else None
+    process = partial(process_injuries, roster=roster, matcher=matcher, audits=audits, max_age=sport.max_age, stats=stats,
+                      reported=reported)
+    if streaming:
+        process = settled_only(process)
+    trackers = []
+    if features_dir:
+        features = FeatureStore(features_dir, sport.label)
+        trackers.append(features)
+    if changes_dir:
+        changes = ChangeTracker(changes_dir, sport.label)
+        trackers.append(changes)
+    if trackers:
+        process = _updating(process, *trackers)
+    try:
+        written = write_incrementally(injury_chunks, process, csv_path, dataset, stats)
+    except BaseException:
+        if dataset is not None:
+            dataset.abort()
+        raise
+
+    if streaming:
+        print(f"Found {injury_buffer.rows} {sport.label} injury records")
+    if audits:
+        pd.concat(audits).to_csv(os.path.join(output_dir, f"{sport.label}_fuzzy_name_matches.csv"), index=False)
+    if dataset is not None:
+        seasons = dataset.commit(start_date, end)
+        print(f"{sport.label} seasons {seasons[0] if seasons else '-'}-{seasons[-1] if seasons else '-'} saved in {store_dir}")
+    if features_dir:
+        features.save()
+        print(f"{features.added} {sport.label} injuries added to the feature store")
+    if changes_dir:
+        delta = changes.commit(start_date.date().isoformat(), end)
+        if delta is None:
+            print(f"No {sport.label} changes since the last run")
+        else:
+            print(f"{sport.label} changes: {delta['inserted']} inserted, {delta['updated']} updated, {delta['deleted']} deleted "
+                  f"({os.path.join(changes_dir, sport.label, delta['file'])})")
+        if cube_dir:
+            _update_cube(InjuryCube(cube_dir, sport.label, sport.season_start_month), changes, delta, stats)
+    if csv_path is not None:
+        print(f"CSV file saved at {csv_path} ({written} rows)")
+    if summary:
+        summary_path = os.path.join(output_dir, f"{sport.label}_run_summary.json")
+        stats.write(summary_path, sport=sport.label, begin=begin, end=end, rows_written=written)
+        print(f"Run summary saved at {summary_path}")
+    if profile_stage and stats.save_profile():
+        print(f"{profile_stage} profile saved at {profile_path}")
+    return csv_path or store_dir
@@ -0,0 +1,133 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from bs4 import BeautifulSoup
+
+from .fetch import make_session
+from .ratelimit import AdaptiveTokenBucket, retry_after_seconds
+
+PROFILE_CACHE = os.path.join('profile_cache', 'birthdays.json')
+PROFILE_URL = "https://www.baseball-reference.com/players/{letter}/{player_id}.shtml"
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+NAME_SUFFIXES = ['Jr.', 'Sr.', 'II', 'III', 'IV', 'V']
+# Profiles tried per player before giving up (ids end in 01, 02, ...)
+MAX_SUFFIX = 20
+
+def remove_suffixes(name, suffixes=NAME_SUFFIXES):
+    cleaned_name = name
+    for suffix in suffixes:
+        if cleaned_name.endswith(suffix):
+            cleaned_name = cleaned_name[:-len(suffix)].strip()
+            break
+    return cleaned_name
+
+# Profile id stem for a name: first five letters of the last name plus the first two of the first name
+# ("Tommy Kahnle" -> "kahnlto"); None when the name has no first and last part
+def profile_stem(player_name):
+    names = remove_suffixes(player_name).split()
+    if len(names) < 2:
+        return None
+    return names[-1].lower()[:5] + names[0].lower()[:2]
+
+# Profile id -> birth date read from that page, kept in a JSON file across runs
+# '' marks a page without a birth date and None a profile that does not exist (404);
+# both are negative results that are never requested again
+class BirthdayCache:
+    def __init__(self, path=PROFILE_CACHE):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.entries = json.load(f)
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def __contains__(self, player_id):
+        return player_id in self.entries
+
+    def get(self, player_id):
+        return self.entries.get(player_id)
+
+    def put(self, player_id, birthday):
+        with self._lock:
+            self.entries[player_id] = birthday
+            self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+# Birthday lookups against baseball-reference player profiles
+# Every request goes through one adaptive token bucket; players are looked up `concurrency` at a time,
+# and each player's profiles (01, 02, ...) are walked in order, skipping ids the cache already answers
+class BirthdayLookup:
+    def __init__(self, cache=None, limiter=None, concurrency=4, session=None, timeout=30, min_year=1980, url=PROFILE_URL):
+        self.cache = cache if cache is not None else BirthdayCache()
+        self.limiter = limiter or AdaptiveTokenBucket()
+        self.concurrency = max(1, concurrency)
+        # 429s are handled by the limiter, so the session only retries server errors
+        self.session = session or make_session(self.concurrency, retry_throttled=False)
+        self.timeout = timeout
+        self.min_year = min_year
+        self.url = url
+        self.requests = 0
+
+    # Birth date on one profile page: the date string, '' when the page has none, None when there is no page
+    def _fetch(self, player_id):
+        while True:
+            self.limiter.acquire()
+            self.requests += 1
+            response = self.session.get(self.url.format(letter=player_id[0], player_id=player_id), headers=HEADERS, timeout=self.timeout)
+            if response.status_code == 429:
+                self.limiter.throttled(retry_after_seconds(response.headers.get('Retry-After')))
+                continue
+            self.limiter.succeeded()
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            birth_span = BeautifulSoup(response.content, 'html.parser').find('span', {'id': 'necro-birth'})
+            return birth_span.get('data-birth', '') if birth_span else ''
+
+    # First profile for the name with a birth date in or after min_year (older namesakes are skipped)
+    def birthday(self, player_name):
+        stem = profile_stem(player_name)
+        if stem is None:
+            print(f"Invalid player name format: {player_name}")
+            return None
+        for number in range(1, MAX_SUFFIX + 1):
+            player_id = f"{stem}{number:02}"
+            if player_id in self.cache:
+                birthday = self.cache.get(player_id)
+            else:
+                try:
+                    birthday = self._fetch(player_id)
+                except requests.exceptions.RequestException as e:
+                    # Transient failures are not cached, so the next run asks again
+                    print(f"Error retrieving data for {player_name}: {e}")
+                    return None
+                self.cache.put(player_id, birthday)
+            if birthday is None:
+                return None
+            if birthday and int(birthday[:4]) >= self.min_year:
+                return birthday
+        return None
+
+    # Birthdays for many players at once ({name: birthday or None}); the cache is saved at the end
+    def birthdays(self, player_names):
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                return dict(zip(player_names, pool.map(self.birthday, player_names)))
+        finally:
+            self.cache.save()
@@ -0,0 +1,142 @@
+import argparse
+import glob
+import os
+import pickle
+import re
+
+import numpy as np
+import pandas as pd
+
+from .schema import OUTPUT_SCHEMA, apply_schema
+from .store import STORE_DIR, read_store
+
+INDEX_FILE = '_query_index.pkl'
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+def _tokens(text):
+    return set(_TOKEN_RE.findall(text.lower())) if isinstance(text, str) else set()
+
+# Sorted row numbers per value of a column
+def _value_index(values):
+    codes, uniques = pd.factorize(values, sort=False)
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    return {str(value).lower(): order[bounds[i]:bounds[i + 1]].astype(np.int64) for i, value in enumerate(uniques)}
+
+# Prebuilt indexes over the merged injury rows
+#   tokens:    word of the injury text -> rows
+#   body_part / player / position / sport: value (lowercased) -> rows
+#   dates/ages: rows ordered by Injury date / Age for range lookups with searchsorted
+# Every lookup yields a sorted array of row numbers, and filters combine by intersecting those arrays
+class InjuryIndex:
+    def __init__(self, df):
+        self.df = df.reset_index(drop=True)
+        injury_codes, injury_texts = pd.factorize(self.df['Injury'])
+        rows_by_injury = _value_index(injury_codes)
+        token_rows = {}
+        for code, text in enumerate(injury_texts):
+            for token in _tokens(text):
+                token_rows.setdefault(token, []).append(rows_by_injury[str(code)])
+        self.tokens = {token: np.sort(np.concatenate(rows)) for token, rows in token_rows.items()}
+
+        self.values = {}
+        for column in ['Body part', 'Player', 'Position', 'sport']:
+            if column in self.df.columns:
+                self.values[column] = _value_index(self.df[column])
+
+        self.date_order, self.sorted_dates = self._sorted(self.df['Injury date'].values.astype('datetime64[ns]'))
+        self.age_order, self.sorted_ages = self._sorted(self.df['Age'].astype('float64').to_numpy())
+
+    @staticmethod
+    def _sorted(values):
+        keep = np.flatnonzero(~pd.isna(values))
+        order = keep[np.argsort(values[keep], kind='stable')]
+        return order, values[order]
+
+    def _range(self, order, sorted_values, low, high):
+        start = 0 if low is None else np.searchsorted(sorted_values, low, side='left')
+        stop = len(sorted_values) if high is None else np.searchsorted(sorted_values, high, side='right')
+        return np.sort(order[start:stop])
+
+    def _value_rows(self, column, value):
+        return self.values.get(column, {}).get(str(value).lower(), np.empty(0, dtype=np.int64))
+
+    # Rows matching every given filter
+    # keywords: words that must all appear in the injury text; age band and date window are inclusive
+    def query(self, keywords=None, body_part=None, player=None, position=None, sport=None,
+              min_age=None, max_age=None, start=None, end=None):
+        selections = []
+        for keyword in keywords or []:
+            for token in _tokens(keyword):
+                selections.append(self.tokens.get(token, np.empty(0, dtype=np.int64)))
+        for column, value in [('Body part', body_part), ('Player', player), ('Position', position), ('sport', sport)]:
+            if value is not None:
+                selections.append(self._value_rows(column, value))
+        if min_age is not None or max_age is not None:
+            selections.append(self._range(self.age_order, self.sorted_ages, min_age, max_age))
+        if start is not None or end is not None:
+            low = None if start is None else np.datetime64(pd.Timestamp(start), 'ns')
+            high = None if end is None else np.datetime64(pd.Timestamp(end), 'ns')
+            selections.append(self._range(self.date_order, self.sorted_dates, low, high))
+
+        if not selections:
+            return self.df
+        rows = selections[0]
+        for selection in selections[1:]:
+            rows = np.intersect1d(rows, selection, assume_unique=True)
+        return self.df.iloc[rows]
+
+def _store_mtime(store_dir):
+    files = glob.glob(os.path.join(store_dir, 'sport=*', 'season=*', '*.parquet'))
+    return max((os.path.getmtime(path) for path in files), default=0)
+
+# Index over the columnar store, or over a merged CSV when csv_path is given
+# The store's index is pickled next to it (as plain state, so it loads the same from the CLI) and only rebuilt
+# after the store changes
+def load_index(store_dir=STORE_DIR, csv_path=None):
+    if csv_path is not None:
+        return InjuryIndex(apply_schema(pd.read_csv(csv_path), OUTPUT_SCHEMA))
+
+    index_path = os.path.join(store_dir, INDEX_FILE)
+    if os.path.exists(index_path) and os.path.getmtime(index_path) >= _store_mtime(store_dir):
+        index = InjuryIndex.__new__(InjuryIndex)
+        with open(index_path, 'rb') as f:
+            index.__dict__.update(pickle.load(f))
+        return index
+    index = InjuryIndex(read_store(store_dir))
+    with open(index_path, 'wb') as f:
+        pickle.dump(index.__dict__, f)
+    return index
+
+def _age_band(text):
+    low, _, high = text.partition('-')
+    return (int(low) if low else None), (int(high) if high else None)
+
+# python -m injury_pipeline.query --keyword hamstring --position P --age 25-30 --from 2015-01-01 --to 2019-12-31
+def main():
+    parser = argparse.ArgumentParser(prog='injury_pipeline.query', description='Filter the merged injury data.')
+    parser.add_argument('--keyword', action='append', help='word in the injury text (repeatable, all must match)')
+    parser.add_argument('--body-part')
+    parser.add_argument('--player')
+    parser.add_argument('--position')
+    parser.add_argument('--sport', help='league label, e.g. MLB')
+    parser.add_argument('--age', type=_age_band, default=(None, None), help='age band such as 25-30, 30- or -24')
+    parser.add_argument('--from', dest='start', help='first injury date (YYYY-MM-DD)')
+    parser.add_argument('--to', dest='end', help='last injury date (YYYY-MM-DD)')
+    parser.add_argument('--store-dir', default=STORE_DIR)
+    parser.add_argument('--csv', help='query a Merged_*.csv instead of the store')
+    parser.add_argument('--out', help='write the matching rows to this CSV instead of printing them')
+    args = parser.parse_args()
+
+    index = load_index(args.store_dir, args.csv)
+    result = index.query(keywords=args.keyword, body_part=args.body_part, player=args.player, position=args.position,
+                         sport=args.sport, min_age=args.age[0], max_age=args.age[1], start=args.start, end=args.end)
+    if args.out:
+        result.to_csv(args.out, index=False)
+        print(f"{len(result)} rows saved at {args.out}")
+    else:
+        print(result.to_string(index=False))
+
+if __name__ == '__main__':
+    main()
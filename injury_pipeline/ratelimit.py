@@ -0,0 +1,64 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Seconds to wait from a Retry-After header (delay in seconds or an HTTP date); None if absent or unreadable
+def retry_after_seconds(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+# Token bucket shared by every thread talking to one site
+# rate: requests per second, refilled continuously up to `burst` tokens
+# The rate adapts: each throttled response (429) halves it and pauses the bucket for the Retry-After delay;
+# each success adds `increase` back, up to max_rate
+class AdaptiveTokenBucket:
+    def __init__(self, rate=0.3, burst=1, min_rate=0.02, max_rate=None, increase=0.01, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate
+        self.increase = increase
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = float(burst)
+        self.updated = clock()
+        self.paused_until = 0.0
+        self.throttles = 0
+        self._lock = threading.Lock()
+
+    # Block until a request may be sent
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+            self.sleep(wait)
+
+    def throttled(self, retry_after=None):
+        with self._lock:
+            self.throttles += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            delay = retry_after if retry_after is not None else 1 / self.rate
+            self.paused_until = max(self.paused_until, self.clock() + delay)
+            self.tokens = 0.0
+
+    def succeeded(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
@@ -0,0 +1,145 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from .dates import age_at
+from .features import FEATURES_DIR, FeatureStore, training_set
+from .schema import ROSTER_SCHEMA, apply_schema
+from .sports import SPORT_MODULES, get_sport
+
+MODEL_DIR = 'models'
+# An injury counts as severe (label 1) when it keeps the player out at least this many days
+SEVERE_DAYS = 60
+SCORE_COLUMN = 'Severe injury probability'
+NUMERIC_COLUMNS = ['Height', 'Weight', 'Age', 'Prior injuries', 'Prior days out']
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -35, 35)))
+
+# L2-regularized logistic regression fitted with Newton steps (a handful of columns, so each step is a tiny solve)
+def _fit_logistic(X, y, l2=1.0, iterations=50, tol=1e-8):
+    X = np.hstack([np.ones((len(X), 1)), X])
+    penalty = np.full(X.shape[1], l2)
+    penalty[0] = 0.0
+    weights = np.zeros(X.shape[1])
+    for _ in range(iterations):
+        p = _sigmoid(X @ weights)
+        gradient = X.T @ (p - y) + penalty * weights
+        hessian = (X * (p * (1 - p))[:, None]).T @ X + np.diag(penalty)
+        step = np.linalg.solve(hessian, gradient)
+        weights -= step
+        if np.abs(step).max() < tol:
+            break
+    return weights
+
+# Chance that a player's next injury is severe (SEVERE_DAYS or more out), from Position, Height, Weight, Age
+# and injury history; the preprocessing (median fill, scaling, position one-hot) is part of the model
+# and saved with it
+class RiskModel:
+    def __init__(self, weights=None, fill=None, mean=None, scale=None, positions=None):
+        self.weights = weights
+        self.fill = fill
+        self.mean = mean
+        self.scale = scale
+        self.positions = positions
+
+    def _matrix(self, df):
+        numeric = df[NUMERIC_COLUMNS].astype('float64').to_numpy()
+        numeric = np.where(np.isnan(numeric), self.fill, numeric)
+        numeric = (numeric - self.mean) / self.scale
+        # Unknown positions get no position column at all
+        codes = pd.Categorical(df['Position'].astype(str), categories=self.positions).codes
+        one_hot = np.zeros((len(df), len(self.positions)))
+        known = codes >= 0
+        one_hot[np.flatnonzero(known), codes[known]] = 1.0
+        return np.hstack([numeric, one_hot])
+
+    def fit(self, df, l2=1.0):
+        numeric = df[NUMERIC_COLUMNS].astype('float64').to_numpy()
+        self.fill = np.nan_to_num(np.nanmedian(numeric, axis=0))
+        numeric = np.where(np.isnan(numeric), self.fill, numeric)
+        self.mean = numeric.mean(axis=0)
+        self.scale = numeric.std(axis=0)
+        self.scale[self.scale == 0] = 1.0
+        self.positions = np.array(sorted(df['Position'].dropna().astype(str).unique()), dtype=str)
+        labels = (df['Days out'].astype('float64').to_numpy() >= SEVERE_DAYS).astype('float64')
+        self.weights = _fit_logistic(self._matrix(df), labels, l2)
+        return self
+
+    # Scores for every row at once
+    def predict(self, df):
+        return _sigmoid(self.weights[0] + self._matrix(df) @ self.weights[1:])
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        np.savez(path, weights=self.weights, fill=self.fill, mean=self.mean, scale=self.scale,
+                 positions=self.positions, columns=np.array(NUMERIC_COLUMNS), severe_days=SEVERE_DAYS)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as saved:
+            if list(saved['columns']) != NUMERIC_COLUMNS or int(saved['severe_days']) != SEVERE_DAYS:
+                raise ValueError(f"{path} was trained with different inputs; retrain it")
+            return cls(saved['weights'], saved['fill'], saved['mean'], saved['scale'], saved['positions'])
+
+def model_path(sport_label, model_dir=MODEL_DIR):
+    return os.path.join(model_dir, f"{sport_label}_risk.npz")
+
+# Fit one sport's model on its feature store (see injury_pipeline.features) and save it
+def train(sport_label, features_dir=FEATURES_DIR, model_dir=MODEL_DIR):
+    model = RiskModel().fit(training_set(features_dir, [sport_label]))
+    model.save(model_path(sport_label, model_dir))
+    return model
+
+# Score a whole roster (Player, DOB, Height, Weight, Position) as of a date
+# The model is trained on injuries only, so the score is the chance that a player's next injury is severe,
+# not the chance of getting injured; it is written as 'Severe injury probability'
+# Injury history comes from the feature store totals, which are keyed by the roster's own spelling of each
+# name, so fuzzy- and substring-matched players keep theirs; players without recorded injuries score with none
+def score_roster(model, roster, sport_label, as_of=None, features_dir=FEATURES_DIR):
+    as_of = pd.Timestamp(as_of) if as_of is not None else pd.Timestamp.today().normalize()
+    history = FeatureStore(features_dir, sport_label).players
+    if history is None:
+        history = pd.DataFrame({'Injuries': [], 'Days out': []}, index=pd.Index([], dtype=str))
+    totals = history[['Injuries', 'Days out']].reindex(roster['Player'].astype(str))
+
+    inputs = pd.DataFrame({
+        'Position': roster['Position'].to_numpy(),
+        'Height': roster['Height'].to_numpy(),
+        'Weight': roster['Weight'].to_numpy(),
+        'Age': age_at(roster['DOB'], pd.Series(as_of, index=roster.index)).to_numpy(),
+        'Prior injuries': totals['Injuries'].fillna(0).to_numpy(),
+        'Prior days out': totals['Days out'].fillna(0).to_numpy(),
+    })
+    scored = roster.assign(**{'Prior injuries': inputs['Prior injuries'].to_numpy(), SCORE_COLUMN: model.predict(inputs)})
+    return scored.sort_values(SCORE_COLUMN, ascending=False, kind='stable')
+
+# python -m injury_pipeline.risk train baseball
+# python -m injury_pipeline.risk score baseball --as-of 2025-04-01 --out MLB_severe.csv
+def main():
+    parser = argparse.ArgumentParser(prog='injury_pipeline.risk', description='Train and apply severe-injury models.')
+    parser.add_argument('command', choices=['train', 'score'])
+    parser.add_argument('sport', choices=SPORT_MODULES)
+    parser.add_argument('--as-of', help='date ages are computed at when scoring (default: today)')
+    parser.add_argument('--features-dir', default=FEATURES_DIR)
+    parser.add_argument('--model-dir', default=MODEL_DIR)
+    parser.add_argument('--out', help='CSV for the scored roster (default: <label>_severe_injury_probability.csv)')
+    args = parser.parse_args()
+
+    sport = get_sport(args.sport)
+    if args.command == 'train':
+        train(sport.label, args.features_dir, args.model_dir)
+        print(f"{sport.label} model saved at {model_path(sport.label, args.model_dir)}")
+        return
+
+    model = RiskModel.load(model_path(sport.label, args.model_dir))
+    roster = apply_schema(sport.load_roster(), ROSTER_SCHEMA)
+    scored = score_roster(model, roster, sport.label, args.as_of, args.features_dir)
+    out = args.out or f"{sport.label}_severe_injury_probability.csv"
+    scored.to_csv(out, index=False)
+    print(f"{len(scored)} {sport.label} players scored, saved at {out}")
+
+if __name__ == '__main__':
+    main()
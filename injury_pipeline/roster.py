@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from .dates import parse_dates
+from .frames import read_frame, write_frame
+
+ROSTER_CACHE_DIR = 'roster_cache'
+# Bumped whenever the build functions change what they produce, so older artifacts are rebuilt
+ROSTER_VERSION = 2
+
+# Vectorized clean_name: letters and spaces only, lowercased ('' for missing names)
+def clean_names(names):
+    return names.fillna('').astype(str).str.replace(r'[^a-zA-Z\s]', '', regex=True).str.strip().str.lower()
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _source_state(path, previous=None):
+    stat = os.stat(path)
+    state = {'size': stat.st_size, 'mtime': stat.st_mtime}
+    # Only rehash when size or mtime moved
+    if previous and previous['size'] == state['size'] and previous['mtime'] == state['mtime']:
+        state['sha256'] = previous['sha256']
+    else:
+        state['sha256'] = _file_hash(path)
+    return state
+
+# Roster frame for `name`, rebuilt with build() only when one of the source files changed
+# The prepared frame is stored in roster_cache/ with a manifest of the sources' sizes, mtimes and SHA-256
+def cached_roster(name, sources, build, cache_dir=ROSTER_CACHE_DIR):
+    os.makedirs(cache_dir, exist_ok=True)
+    manifest_path = os.path.join(cache_dir, name + '.json')
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    previous = manifest.get('sources', {})
+    states = {path: _source_state(path, previous.get(path)) for path in sources}
+    artifact = manifest.get('artifact')
+    if artifact and os.path.exists(artifact) and manifest.get('version') == ROSTER_VERSION:
+        unchanged = all(previous.get(path, {}).get('sha256') == state['sha256'] for path, state in states.items())
+        if unchanged:
+            if states != previous:
+                # Touched but identical files: remember the new mtimes so they are not rehashed next time
+                manifest['sources'] = states
+                with open(manifest_path, 'w') as f:
+                    json.dump(manifest, f)
+            return read_frame(artifact), False
+
+    df = build(*sources)
+    artifact = write_frame(df, os.path.join(cache_dir, name))
+    with open(manifest_path, 'w') as f:
+        json.dump({'sources': states, 'artifact': artifact, 'version': ROSTER_VERSION}, f)
+    return df, True
+
+# MLB roster: Retrosheet biofile (height, weight, DOB) joined with master.csv (positions)
+# A biofile player matches a master row on birth date plus either "NICKNAME LAST" or "FIRST LAST";
+# both candidate keys go through one join and the nickname form wins when both match
+def build_mlb_roster(master_path, biofile_path):
+    master_data = pd.read_csv(master_path, usecols=['mlb_name', 'mlb_pos', 'birth_date'])
+    master_data['CLEAN_MLB_NAME'] = clean_names(master_data['mlb_name'].str.replace(r'\(.*?\)', '', regex=True))
+    master_data['birth_date'] = parse_dates(master_data['birth_date'])
+    master_data = master_data.drop_duplicates(subset=['CLEAN_MLB_NAME', 'birth_date'])
+
+    biofile_data = pd.read_csv(biofile_path, usecols=['NICKNAME', 'FIRST', 'LAST', 'BIRTHDATE', 'HEIGHT', 'WEIGHT'], low_memory=False)
+    biofile_data['BIRTHDATE'] = parse_dates(biofile_data['BIRTHDATE'])
+    biofile_data['bio_row'] = range(len(biofile_data))
+
+    keys = pd.concat([
+        biofile_data.assign(Player=biofile_data['NICKNAME'] + ' ' + biofile_data['LAST'], priority=0),
+        biofile_data.assign(Player=biofile_data['FIRST'] + ' ' + biofile_data['LAST'], priority=1),
+    ], ignore_index=True)
+    keys['CLEAN_NAME'] = clean_names(keys['Player'])
+    keys = keys[keys['CLEAN_NAME'] != '']
+
+    matched = pd.merge(keys, master_data, left_on=['CLEAN_NAME', 'BIRTHDATE'], right_on=['CLEAN_MLB_NAME', 'birth_date'], how='inner')
+    matched = matched[matched['mlb_pos'].notna()]
+    matched = matched.sort_values(['bio_row', 'priority'], kind='stable').drop_duplicates(subset='bio_row')
+
+    roster = matched[['Player', 'BIRTHDATE', 'HEIGHT', 'WEIGHT', 'mlb_pos']]
+    return roster.rename(columns={
+        'BIRTHDATE': 'DOB',
+        'HEIGHT': 'Height',
+        'WEIGHT': 'Weight',
+        'mlb_pos': 'Position'
+    }).reset_index(drop=True)
+
+# NBA roster: common_player_info.csv with parsed birthdates
+def build_nba_roster(path):
+    df_players = pd.read_csv(path)
+    df_players['birthdate'] = parse_dates(df_players['birthdate'])
+    return df_players
+
+# Roster already in the pipeline's layout: Player, DOB, Height, Weight, Position
+def build_player_file(path):
+    roster = pd.read_csv(path, usecols=['Player', 'DOB', 'Height', 'Weight', 'Position'])
+    roster['DOB'] = parse_dates(roster['DOB'])
+    return roster
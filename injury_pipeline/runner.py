@@ -0,0 +1,22 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Manager
+from urllib.parse import urlsplit
+
+from .fetch import DEFAULT_HOST_LIMIT, share_host_limit
+from .pipeline import run_sport
+from .sports import SOURCE
+
+def _run_with_budget(name, budget, options):
+    if budget is not None:
+        share_host_limit(urlsplit(options.get('source', SOURCE)).netloc, budget)
+    return run_sport(name, **options)
+
+# Run several sports at once, one process each
+# All processes draw from one budget of simultaneous requests to the source site (fetch_budget),
+# so adding sports does not multiply the load on it; options are passed on to run_sport
+def run_sports(names, processes=None, fetch_budget=DEFAULT_HOST_LIMIT, **options):
+    with Manager() as manager:
+        budget = manager.BoundedSemaphore(fetch_budget) if fetch_budget else None
+        with ProcessPoolExecutor(max_workers=processes or len(names)) as pool:
+            futures = {name: pool.submit(_run_with_budget, name, budget, options) for name in names}
+            return {name: future.result() for name, future in futures.items()}
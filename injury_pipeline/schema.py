@@ -0,0 +1,61 @@
+import pandas as pd
+
+from .dates import parse_dates
+
+# Column types for the frames the pipeline passes around
+# 'datetime' columns go through parse_dates, 'height' columns are converted to whole inches,
+# anything else is a pandas dtype name
+INJURY_SCHEMA = {
+    'Date': 'datetime',
+    'Team': 'category',
+    'Player': 'category',
+    'Notes': 'string',
+}
+
+ROSTER_SCHEMA = {
+    'Player': 'string',
+    'DOB': 'datetime',
+    'Height': 'height',
+    'Weight': 'Int16',
+    'Position': 'category',
+}
+
+OUTPUT_SCHEMA = {
+    'Player': 'category',
+    'Roster name': 'category',
+    'Position': 'category',
+    'Injury': 'category',
+    'Injury date': 'datetime',
+    'Return date': 'datetime',
+    'Days out': 'Int16',
+    'Height': 'Int16',
+    'Weight': 'Int16',
+    'Age': 'Int8',
+    'Injury type': 'category',
+    'Body part': 'category',
+}
+
+# Heights as nullable whole inches: "6-3", "6'3\"" and "6 3" are feet and inches, plain numbers are inches already
+def height_inches(values):
+    values = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(values):
+        return pd.to_numeric(values, errors='coerce').round().astype('Int16')
+    strings = values.astype('string').str.strip()
+    feet_inches = strings.str.extract(r'^(\d+)\s*(?:-|\'|\s)\s*(\d+(?:\.\d+)?)"?$')
+    inches = pd.to_numeric(feet_inches[0], errors='coerce') * 12 + pd.to_numeric(feet_inches[1], errors='coerce')
+    inches = inches.fillna(pd.to_numeric(strings, errors='coerce'))
+    return inches.round().astype('Int16')
+
+def _cast(values, kind):
+    if kind == 'datetime':
+        return parse_dates(values)
+    if kind == 'height':
+        return height_inches(values)
+    if kind.startswith('Int'):
+        return pd.to_numeric(values, errors='coerce').round().astype(kind)
+    return values.astype(kind)
+
+# Cast the columns of df that appear in schema (other columns are left alone)
+def apply_schema(df, schema):
+    casts = {column: _cast(df[column], kind) for column, kind in schema.items() if column in df.columns and str(df[column].dtype) != kind}
+    return df.assign(**casts) if casts else df
@@ -0,0 +1,190 @@
+import json
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
+from .fetch import PAGE_SIZE
+
+DEFAULT_WORKERS = 4
+
+# Directory name for the host serving base_url, so checkpoints of a stand-in server never feed a real run
+def source_dir(base_url):
+    return urlsplit(base_url).netloc.replace(':', '_') or 'local'
+
+# BeginDate/EndDate of a search URL as dates
+def url_date_range(base_url):
+    query = parse_qs(urlsplit(base_url).query, keep_blank_values=True)
+    return date.fromisoformat(query['BeginDate'][0]), date.fromisoformat(query['EndDate'][0])
+
+# The same search restricted to [begin, end]; the start= offset stays last so it can be appended
+def shard_url(base_url, begin, end):
+    parts = urlsplit(base_url)
+    query = parse_qs(parts.query, keep_blank_values=True)
+    query['BeginDate'] = [begin.isoformat()]
+    query['EndDate'] = [end.isoformat()]
+    query.pop('start', None)
+    pairs = [(key, values[0]) for key, values in query.items()]
+    return urlunsplit(parts._replace(query=urlencode(pairs) + '&start='))
+
+# Split [begin, end] into consecutive shards
+# freq='season' cuts at season_start_month each year (1 for MLB, 10 for the NBA); freq='month' cuts monthly
+def shard_ranges(begin, end, freq='season', season_start_month=1):
+    shards = []
+    current = begin
+    while current <= end:
+        if freq == 'month':
+            year, month = current.year + current.month // 12, current.month % 12 + 1
+        elif freq == 'season':
+            year = current.year + (1 if current.month >= season_start_month else 0)
+            month = season_start_month
+        else:
+            raise ValueError(f"Unknown shard frequency: {freq}")
+        next_start = date(year, month, 1)
+        shards.append((current, min(end, next_start - timedelta(days=1))))
+        current = next_start
+    return shards
+
+# Per-shard progress on disk
+# <begin>_<end>.part.jsonl holds the pages fetched so far (one line per page, with its offset);
+# <begin>_<end>.json marks the shard as finished and holds all of its rows
+class ShardCheckpoint:
+    def __init__(self, directory, begin, end):
+        name = f"{begin.isoformat()}_{end.isoformat()}"
+        self.end = end
+        self.done_path = os.path.join(directory, name + '.json')
+        self.part_path = os.path.join(directory, name + '.part.jsonl')
+
+    # Rows of a finished shard, or None if it must be (re)scraped
+    # A shard still open when it was scraped (end date not yet passed) is scraped again
+    def load_done(self):
+        if not os.path.exists(self.done_path):
+            return None
+        with open(self.done_path) as f:
+            done = json.load(f)
+        if date.fromisoformat(done['scraped_on']) <= self.end:
+            return None
+        return done['rows']
+
+    # Rows and next offset saved by an interrupted run
+    def load_partial(self):
+        rows = []
+        next_offset = 0
+        if os.path.exists(self.part_path):
+            with open(self.part_path) as f:
+                for line in f:
+                    try:
+                        page = json.loads(line)
+                    except ValueError:
+                        # Last line cut off by a kill
+                        break
+                    rows.extend(page['rows'])
+                    next_offset = page['offset'] + PAGE_SIZE
+        return rows, next_offset
+
+    def append_page(self, offset, rows):
+        with open(self.part_path, 'a') as f:
+            f.write(json.dumps({'offset': offset, 'rows': rows}) + '\n')
+
+    def discard_partial(self):
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+
+    def finish(self, rows):
+        tmp_path = self.done_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'scraped_on': date.today().isoformat(), 'rows': rows}, f)
+        os.replace(tmp_path, self.done_path)
+        self.discard_partial()
+
+# Scrape one shard with its own offset cursor, resuming from its checkpoint
+# on_page, if given, is called with each batch of rows as soon as it is available
+# A non-incremental fetcher (--full) ignores earlier checkpoints and scrapes the shard from the start;
+# an offline fetcher only sees the page cache, so it neither trusts nor writes checkpoints of what it got
+def scrape_shard(fetcher, base_url, begin, end, checkpoint_dir, on_page=None):
+    checkpoint = ShardCheckpoint(checkpoint_dir, begin, end)
+    rows = checkpoint.load_done() if fetcher.incremental else None
+    if rows is not None:
+        fetcher.stats.count('shards_reused')
+        if on_page is not None and rows:
+            on_page(rows)
+        return rows
+
+    if fetcher.incremental:
+        rows, next_offset = checkpoint.load_partial()
+    else:
+        rows, next_offset = [], 0
+        checkpoint.discard_partial()
+    if on_page is not None and rows:
+        on_page(list(rows))
+    for offset, page_rows in fetcher.iter_pages(shard_url(base_url, begin, end), start=next_offset):
+        if not fetcher.offline:
+            checkpoint.append_page(offset, page_rows)
+        rows.extend(page_rows)
+        if on_page is not None:
+            on_page(page_rows)
+    if not fetcher.offline:
+        checkpoint.finish(rows)
+    return rows
+
+# Rows from every shard, in shard order, with repeated rows dropped
+# (a page boundary shifting between requests can list the same transaction twice)
+def merge_shards(shard_rows):
+    seen = set()
+    merged = []
+    for rows in shard_rows:
+        for row in rows:
+            key = tuple(row)
+            if key not in seen:
+                seen.add(key)
+                merged.append(row)
+    return merged
+
+# Scrape the BeginDate..EndDate range of base_url as independent shards run by `workers` threads
+# All shards share the fetcher, so its connection pool and per-host limit apply across them
+def scrape_sharded(fetcher, base_url, checkpoint_dir, workers=DEFAULT_WORKERS, freq='season', season_start_month=1):
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    begin, end = url_date_range(base_url)
+    shards = shard_ranges(begin, end, freq, season_start_month)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(scrape_shard, fetcher, base_url, shard_begin, shard_end, checkpoint_dir) for shard_begin, shard_end in shards]
+        shard_rows = [future.result() for future in futures]
+    return merge_shards(shard_rows)
+
+# Like scrape_sharded, but yields (rows, complete_before) as pages arrive from any shard instead of
+# returning everything at the end. Batches are not in date order and repeats are not removed;
+# complete_before is the begin date of the earliest unfinished shard (the day after `end` once all are done),
+# so every row dated before it has already been yielded. A finished shard yields an empty batch
+# A bounded queue keeps fast shards from running far ahead of the consumer
+def iter_sharded(fetcher, base_url, checkpoint_dir, workers=DEFAULT_WORKERS, freq='season', season_start_month=1):
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    begin, end = url_date_range(base_url)
+    shards = shard_ranges(begin, end, freq, season_start_month)
+    pages = queue.Queue(maxsize=max(1, workers) * 4)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = []
+        for shard in shards:
+            on_page = lambda rows, shard=shard: pages.put((shard, rows))
+            future = pool.submit(scrape_shard, fetcher, base_url, shard[0], shard[1], checkpoint_dir, on_page)
+            future.add_done_callback(lambda done, shard=shard: done.cancelled() or pages.put((shard, None)))
+            futures.append(future)
+        try:
+            unfinished = list(shards)
+            while unfinished:
+                shard, rows = pages.get()
+                if rows is None:
+                    # A failed shard must not count as finished, or rows after it would look complete
+                    futures[shards.index(shard)].result()
+                    unfinished.remove(shard)
+                    rows = []
+                yield rows, unfinished[0][0] if unfinished else end + timedelta(days=1)
+        finally:
+            for future in futures:
+                future.cancel()
+            # Keep draining so running shards are not stuck on a full queue
+            while not all(future.done() for future in futures):
+                try:
+                    pages.get(timeout=0.1)
+                except queue.Empty:
+                    pass
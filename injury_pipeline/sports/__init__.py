@@ -0,0 +1,31 @@
+import importlib
+
+SOURCE = 'https://www.prosportstransactions.com'
+SEARCH_URL = ("{source}/{path}/Search/SearchResults.php?Player=&Team="
+              "&BeginDate={begin}&EndDate={end}&InjuriesChkBx=yes&submit=Search&start=")
+
+# A sport plugin: where its injuries are listed, how its roster is loaded and how names are matched
+# load_roster() returns one row per player with Player, DOB, Height, Weight and Position columns
+# matcher is a class from injury_pipeline.matching, built over the roster's Player column
+# max_age, if set, drops injuries suffered at that age or older
+class Sport:
+    def __init__(self, name, label, url_path, load_roster, matcher, season_start_month=1, max_age=None):
+        self.name = name
+        self.label = label
+        self.url_path = url_path
+        self.load_roster = load_roster
+        self.matcher = matcher
+        self.season_start_month = season_start_month
+        self.max_age = max_age
+
+    # Search URL for [begin, end] (ISO dates); the start= offset is appended by the fetcher
+    def search_url(self, begin, end, source=SOURCE):
+        return SEARCH_URL.format(source=source, path=self.url_path, begin=begin, end=end)
+
+# Plugin modules under injury_pipeline.sports; each defines SPORT
+SPORT_MODULES = ['baseball', 'basketball', 'football', 'hockey']
+
+def get_sport(name):
+    if name not in SPORT_MODULES:
+        raise ValueError(f"Unknown sport: {name} (available: {', '.join(SPORT_MODULES)})")
+    return importlib.import_module(f"{__name__}.{name}").SPORT
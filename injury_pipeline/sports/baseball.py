@@ -0,0 +1,16 @@
+from ..matching import SubstringThenFuzzy
+from ..roster import build_mlb_roster, cached_roster
+from . import Sport
+
+# Two databases used for player data collection
+# https://www.retrosheet.org/biofile.htm for player height, weight, DOB, name, etc.
+# https://github.com/toddrob99/MLB-StatsAPI/blob/be8210d89e42625f1db22275d36bf3c6fb559b57/statsapi/endpoints.py for player positions
+
+# Biofile joined with master positions, or the prepared copy from roster_cache/ when neither file changed
+def load_roster():
+    roster, rebuilt = cached_roster('mlb', ['master.csv', 'biofile.csv'], build_mlb_roster)
+    if rebuilt:
+        roster.to_csv("player_data_with_positions.csv", index=False)
+    return roster
+
+SPORT = Sport('baseball', 'MLB', 'baseball', load_roster, SubstringThenFuzzy)
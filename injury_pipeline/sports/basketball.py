@@ -0,0 +1,19 @@
+from ..matching import ExactThenFuzzy
+from ..roster import build_nba_roster, cached_roster
+from . import Sport
+
+# Database found on https://www.kaggle.com/datasets/wyattowalsh/basketball?resource=download
+
+# common_player_info.csv (prepared copy in roster_cache/ unless the CSV changed)
+def load_roster():
+    df_players, _ = cached_roster('nba', ['common_player_info.csv'], build_nba_roster)
+    return df_players.rename(columns={
+        'display_first_last': 'Player',
+        'birthdate': 'DOB',
+        'height': 'Height',
+        'weight': 'Weight',
+        'position': 'Position'
+    })[['Player', 'DOB', 'Height', 'Weight', 'Position']].reset_index(drop=True)
+
+# NBA seasons run October to September; only players under 45 at the time of the injury are kept
+SPORT = Sport('basketball', 'NBA', 'basketball', load_roster, ExactThenFuzzy, season_start_month=10, max_age=45)
@@ -0,0 +1,11 @@
+from ..matching import ExactThenFuzzy
+from ..roster import build_player_file, cached_roster
+from . import Sport
+
+# Player database: nfl_players.csv with Player, DOB, Height, Weight and Position columns
+def load_roster():
+    roster, _ = cached_roster('nfl', ['nfl_players.csv'], build_player_file)
+    return roster
+
+# NFL seasons run September to August
+SPORT = Sport('football', 'NFL', 'football', load_roster, ExactThenFuzzy, season_start_month=9)
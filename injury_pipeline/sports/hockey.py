@@ -0,0 +1,11 @@
+from ..matching import ExactThenFuzzy
+from ..roster import build_player_file, cached_roster
+from . import Sport
+
+# Player database: nhl_players.csv with Player, DOB, Height, Weight and Position columns
+def load_roster():
+    roster, _ = cached_roster('nhl', ['nhl_players.csv'], build_player_file)
+    return roster
+
+# NHL seasons run October to September
+SPORT = Sport('hockey', 'NHL', 'hockey', load_roster, ExactThenFuzzy, season_start_month=10)
@@ -0,0 +1,106 @@
+import os
+import shutil
+import uuid
+
+import pandas as pd
+
+from .frames import concat_frames
+
+STORE_DIR = 'injury_store'
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("The columnar injury store needs pyarrow (pip install pyarrow)") from None
+
+# Season a date belongs to, named after the year it starts in (NBA 2019-20 -> 2019)
+def season_of(dates, season_start_month=1):
+    return (dates.dt.year - (dates.dt.month < season_start_month).astype(int)).astype('Int16')
+
+# Writes a run's output as a Parquet dataset partitioned by sport and season:
+#   <root>/sport=<label>/season=<year>/part-*.parquet
+# Chunks are staged during the run; commit() then swaps in the seasons the run produced and leaves every
+# other season untouched. Given the run's date window it also keeps stored rows of those seasons that fall
+# outside the window, so a run starting mid-season only replaces the part of the season it covered
+class DatasetWriter:
+    def __init__(self, root, sport_label, season_start_month=1, date_column='Injury date'):
+        _require_pyarrow()
+        self.root = root
+        self.sport_dir = os.path.join(root, f"sport={sport_label}")
+        self.staging_dir = os.path.join(root, f".staging-{sport_label}-{uuid.uuid4().hex[:8]}")
+        self.season_start_month = season_start_month
+        self.date_column = date_column
+        self.seasons = set()
+
+    def write(self, df):
+        if df.empty:
+            return
+        seasons = season_of(df[self.date_column], self.season_start_month)
+        for season, part in df.groupby(seasons.values):
+            season_dir = os.path.join(self.staging_dir, f"season={season}")
+            os.makedirs(season_dir, exist_ok=True)
+            part.to_parquet(os.path.join(season_dir, f"part-{uuid.uuid4().hex}.parquet"), index=False)
+            self.seasons.add(season)
+
+    def _season(self, day):
+        return int(season_of(pd.Series([pd.Timestamp(day)]), self.season_start_month).iloc[0])
+
+    def _existing_seasons(self):
+        if not os.path.isdir(self.sport_dir):
+            return set()
+        return {int(name.split('=', 1)[1]) for name in os.listdir(self.sport_dir) if name.startswith('season=')}
+
+    # Compact each staged season into one file and swap it in
+    # With a window [begin, end] (the run's injury dates), rows already stored outside it are kept, and
+    # seasons the window touches lose their in-window rows even when the run staged none for them;
+    # without one, every staged season is replaced outright
+    def commit(self, begin=None, end=None):
+        os.makedirs(self.sport_dir, exist_ok=True)
+        windowed = begin is not None or end is not None
+        seasons = {int(season) for season in self.seasons}
+        if windowed:
+            first = self._season(begin) if begin is not None else float('-inf')
+            last = self._season(end) if end is not None else float('inf')
+            seasons |= {season for season in self._existing_seasons() if first <= season <= last}
+        begin = pd.Timestamp(begin) if begin is not None else pd.Timestamp.min
+        end = pd.Timestamp(end) if end is not None else pd.Timestamp.max
+
+        written = []
+        for season in sorted(seasons):
+            staged = os.path.join(self.staging_dir, f"season={season}")
+            target = os.path.join(self.sport_dir, f"season={season}")
+            parts = [pd.read_parquet(os.path.join(staged, name)) for name in sorted(os.listdir(staged))] if os.path.isdir(staged) else []
+            if windowed and os.path.isdir(target):
+                stored = pd.concat([pd.read_parquet(os.path.join(target, name)) for name in sorted(os.listdir(target))], ignore_index=True)
+                dates = stored[self.date_column]
+                parts.append(stored[(dates < begin) | (dates > end)])
+            parts = [part for part in parts if not part.empty]
+
+            shutil.rmtree(staged, ignore_errors=True)
+            if not parts:
+                shutil.rmtree(target, ignore_errors=True)
+                continue
+            season_frame = concat_frames(parts)
+            os.makedirs(staged)
+            season_frame.to_parquet(os.path.join(staged, 'part-0.parquet'), index=False)
+
+            shutil.rmtree(target, ignore_errors=True)
+            os.replace(staged, target)
+            written.append(season)
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        return written
+
+    def abort(self):
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+# Load part of the store: only the requested sports (labels, e.g. 'MLB') and seasons are read,
+# and only the requested columns; partition values come back as the sport and season columns
+def read_store(root=STORE_DIR, sports=None, seasons=None, columns=None):
+    _require_pyarrow()
+    filters = []
+    if sports is not None:
+        filters.append(('sport', 'in', list(sports)))
+    if seasons is not None:
+        filters.append(('season', 'in', [int(season) for season in seasons]))
+    return pd.read_parquet(root, engine='pyarrow', columns=columns, filters=filters or None)
@@ -0,0 +1,112 @@
+import os
+import shutil
+
+import pandas as pd
+
+from .days_out import MAX_DAYS_OUT
+from .instrument import NO_STATS
+from .schema import INJURY_SCHEMA, apply_schema
+
+INJURY_COLUMNS = ['Date', 'Team', 'Player', 'Notes']
+# Days of injuries handed out per window by InjuryBuffer.settled
+DEFAULT_STEP = pd.Timedelta(days=365)
+
+# Scraped rows -> typed injury frame: rows before start_date dropped, list bullets stripped from Player
+def clean_rows(rows, start_date=None):
+    df_injuries = pd.DataFrame(rows, columns=INJURY_COLUMNS)
+    df_injuries['Player'] = df_injuries['Player'].str.replace(r'^\s*•\s*', '', regex=True).str.strip()
+    df_injuries = apply_schema(df_injuries, INJURY_SCHEMA)
+    if start_date is not None:
+        df_injuries = df_injuries[df_injuries['Date'] >= start_date]
+    return df_injuries
+
+# On-disk buffer of cleaned injury rows, one CSV file per calendar year of the injury date
+# The days out of an injury only depend on the player's rows from the injury date up to MAX_DAYS_OUT later,
+# so once the crawl is complete up to some date, every injury more than MAX_DAYS_OUT before it is settled.
+# settled() hands those out a window of `step` days at a time, with the following MAX_DAYS_OUT of rows as
+# context, while the crawl is still appending; memory stays at about two windows whatever the date range
+class InjuryBuffer:
+    def __init__(self, directory, start, step=DEFAULT_STEP):
+        self.directory = directory
+        self.step = step
+        self.rows = 0
+        # Start of the next window to hand out, and the latest injury date appended
+        self.next = pd.Timestamp(start)
+        self.last = None
+        # A buffer always starts empty; rows from an older run would be counted twice
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+
+    def _path(self, year):
+        return os.path.join(self.directory, f"year-{year}.csv")
+
+    def append(self, chunk):
+        if chunk.empty:
+            return
+        for year, part in chunk.groupby(chunk['Date'].dt.year):
+            path = self._path(year)
+            part.to_csv(path, mode='a', header=not os.path.exists(path), index=False, date_format='%Y-%m-%d')
+        self.rows += len(chunk)
+        latest = chunk['Date'].max()
+        self.last = latest if self.last is None else max(self.last, latest)
+
+    # Rows dated in [begin, end), with exact repeats dropped (a transaction listed on two pages)
+    def read(self, begin, end):
+        parts = []
+        for year in range(begin.year, end.year + 1):
+            path = self._path(year)
+            if os.path.exists(path):
+                parts.append(pd.read_csv(path, dtype=str, keep_default_na=False, na_values=['']))
+        if not parts:
+            return clean_rows([])
+        rows = pd.concat(parts, ignore_index=True)
+        # ISO dates compare correctly as text, so rows are cut before parsing
+        rows = rows[(rows['Date'] >= begin.strftime('%Y-%m-%d')) & (rows['Date'] < end.strftime('%Y-%m-%d'))]
+        return apply_schema(rows.drop_duplicates(), INJURY_SCHEMA)
+
+    # (frame, begin, end) for each window of injuries dated before `limit` not handed out yet;
+    # frame also holds the MAX_DAYS_OUT of rows after `end`, so only its injuries in [begin, end) are final
+    # With limit=None the crawl is over and everything left is settled
+    def settled(self, limit=None):
+        if self.last is None:
+            return
+        if limit is None:
+            limit = self.last + pd.Timedelta(days=1)
+        while self.next < limit:
+            begin, end = self.next, min(limit, self.next + self.step)
+            frame = self.read(begin, end + pd.Timedelta(days=MAX_DAYS_OUT))
+            if (frame['Date'] < end).any():
+                yield frame, begin, end
+            self.next = end
+
+# Stream (rows, complete_before) batches from iter_sharded through clean_rows into the buffer and
+# yield each window of injuries as soon as the crawl has settled it
+def iter_settled(batches, buffer, start_date=None):
+    for rows, complete_before in batches:
+        buffer.append(clean_rows(rows, start_date))
+        yield from buffer.settled(pd.Timestamp(complete_before) - pd.Timedelta(days=MAX_DAYS_OUT))
+    yield from buffer.settled()
+
+# process for the (frame, begin, end) windows of InjuryBuffer.settled: keeps the injuries dated in [begin, end)
+def settled_only(process):
+    def process_window(window):
+        frame, begin, end = window
+        result = process(frame)
+        return result[(result['Injury date'] >= begin) & (result['Injury date'] < end)]
+    return process_window
+
+# Run `process` over each chunk and hand its output to the CSV and/or dataset writer as soon as it is ready
+def write_incrementally(chunks, process, csv_path=None, dataset=None, stats=NO_STATS):
+    written = 0
+    header = True
+    for chunk in chunks:
+        result = process(chunk)
+        with stats.stage('write', len(result)) as stage:
+            if csv_path is not None:
+                result.to_csv(csv_path, mode='w' if header else 'a', header=header, index=False)
+                header = False
+            if dataset is not None:
+                dataset.write(result)
+            stage.rows_out = len(result)
+        written += len(result)
+    return written